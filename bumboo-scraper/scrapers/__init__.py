@@ -7,6 +7,8 @@ models
     Shared dataclasses for scraped products and scrape jobs.
 base
     Base scraper definitions and helper utilities.
+normalizer
+    Maps scraped records onto canonical descriptions and sizes.
 registry
     Registry of available scrapers that runner can execute.
 storage
@@ -0,0 +1,27 @@
+"""Regular expressions shared by the storefront scrapers, compiled once."""
+
+from __future__ import annotations
+
+import re
+
+# "3ply" / "3 Ply" -> group(1) is the ply count
+PLY_PATTERN = re.compile(r"(\d+)\s*ply", re.IGNORECASE)
+# everything that is not a digit (whole-dollar and cents fragments)
+PRICE_NONDIGIT = re.compile(r"[^\d]+")
+# everything that is not a digit or decimal point (full prices like "12.50")
+PRICE_DECIMAL = re.compile(r"[^\d.]+")
+# str.translate tables deleting the same characters from ASCII text, several
+# times cheaper than .sub(); the patterns above keep the Unicode digit
+# semantics for anything else
+PRICE_NONDIGIT_TABLE = str.maketrans({c: None for c in map(chr, range(128)) if not c.isdigit()})
+PRICE_DECIMAL_TABLE = str.maketrans({c: None for c in map(chr, range(128)) if not (c.isdigit() or c == ".")})
+# a size token such as "10x200" or "24rolls"
+SIZE_TOKEN = re.compile(r"\b\d+[^\s]*", re.IGNORECASE)
+# first run of digits and dots, e.g. the amount in "$12.50"
+PRICE_NUMBER = re.compile(r"[\d.]+")
+# inline JSON-LD snippets in product page HTML
+AGGREGATE_RATING = re.compile(
+    r'"aggregateRating"\s*:\s*\{[^}]*"ratingValue"\s*:\s*"([^"]+)"[^}]*"reviewCount"\s*:\s*"([^"]+)"',
+    re.S,
+)
+REVIEW_RATING = re.compile(r'"reviewRating"\s*:\s*\{[^}]*"ratingValue"\s*:\s*"([^"]+)"', re.S)
@@ -2,14 +2,48 @@
 
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
-from typing import Any
-
-import requests
-from requests import Response
+from typing import TYPE_CHECKING, Any
 
 from .models import ProductRecord, ScrapeJob
 
+try:  # decodes API payloads several times faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if TYPE_CHECKING:
+    from requests import Response, Session
+
+
+def json_loads(data: str | bytes) -> Any:
+    """json.loads via orjson when installed, falling back to the stdlib parser."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals, lone surrogates, ... which json accepts
+            pass
+    return json.loads(data)
+
+
+def enable_http_cache(cache_name: str = ".scrape_cache", expire_after: int = 3600) -> None:
+    """
+    Serve repeated GETs from an on-disk SQLite cache for every session.
+
+    Meant for development re-runs; honours Cache-Control from the origin.
+    Requires the optional `requests-cache` package.
+    """
+    import requests_cache
+
+    requests_cache.install_cache(
+        cache_name,
+        backend="sqlite",
+        expire_after=expire_after,
+        cache_control=True,
+    )
+
 
 class BaseScraper(ABC):
     """Base class containing shared HTTP helpers and metadata access."""
@@ -21,12 +55,32 @@ class BaseScraper(ABC):
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
         )
     }
+    #: Keep-alive pool sizing; paged scrapers fetch several pages of one host at once.
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 64
 
-    def __init__(self, job: ScrapeJob, *, timeout: float = 15.0) -> None:
+    def __init__(self, job: ScrapeJob, *, timeout: float = 15.0, session: Session | None = None) -> None:
         self.job = job
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update(self.DEFAULT_HEADERS)
+        # a session handed in by the runner is shared with the other jobs so
+        # connections to the same storefront stay open between them
+        self.session = session if session is not None else self.new_session()
+
+    @classmethod
+    def new_session(cls) -> Session:
+        """Create an HTTP session with the default headers and a sized connection pool."""
+        # imported here so code paths that never fetch skip the HTTP stack
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers.update(cls.DEFAULT_HEADERS)
+        # reuse TLS connections across pages instead of re-handshaking once the
+        # default 10-connection pool is exhausted by concurrent page fetches
+        adapter = HTTPAdapter(pool_connections=cls.POOL_CONNECTIONS, pool_maxsize=cls.POOL_MAXSIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def fetch(self, url: str, **kwargs: Any) -> Response:
         """Fetch a URL using the shared session."""
@@ -34,6 +88,12 @@ class BaseScraper(ABC):
         response.raise_for_status()
         return response
 
+    def decode_json(self, response: Response) -> Any:
+        """Decode a JSON response body; orjson reads the raw bytes directly."""
+        if orjson is not None:
+            return json_loads(response.content)
+        return response.json()
+
     def scrape(self) -> list[ProductRecord]:
         """Hook called by the runner."""
         records = self._scrape()
@@ -3,7 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+
+# Shared read-only default for configs without extra options. dataclasses
+# refuse a mappingproxy as a plain default, hence the factory returning it.
+# Mappings are unhashable, so the field is compared but left out of __hash__.
+_EMPTY_OPTIONS: Mapping[str, str] = MappingProxyType({})
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,8 +26,55 @@ class ProductConfig:
     url: str
     size: str | None = None
     ply: str | None = None
-    extra_options: dict[str, str] = field(default_factory=dict)
+    extra_options: Mapping[str, str] = field(default_factory=lambda: _EMPTY_OPTIONS, hash=False)
+
+
+# Category listing and API query shared by every FairPrice brand; only the brand
+# filter differs. `{{page}}` survives `.format(brand=...)` as the runtime page slot.
+_FAIRPRICE_LIST_TEMPLATE = "https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3A{brand}"
+_FAIRPRICE_API_TEMPLATE = (
+    "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
+    "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
+    "category=bathroom-tissues&"
+    "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
+    "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
+    "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
+    "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
+    "camp-lbl-B%2Cpoa-entry-A&filter=brand%3A{brand}&includeTagDetails=true&"
+    "orderType=DELIVERY&page={{page}}&url=bathroom-tissues"
+)
+
+# (brand filter, brand, description) per FairPrice target.
+_FAIRPRICE_BRANDS: tuple[tuple[str, str, str], ...] = (
+    ("kleenex", "Kleenex", "Kleenex assortment at FairPrice"),
+    ("paseo", "Paseo", "Paseo assortment at FairPrice"),
+    ("vinda", "Vinda", "PaVindaseo assortment at FairPrice"),
+    ("pursoft", "Pursoft", "Pursoft assortment at FairPrice"),
+    ("fairprice", "FairPrice", "FairPrice house-brand bathroom tissues"),
+    ("beautex", "Beautex", "Beautex assortment at FairPrice"),
+    ("neutra", "Neutra", "Neutra assortment at FairPrice"),
+    ("cloversoft", "Cloversoft", "Cloversoft assortment at FairPrice"),
+    ("nootrees", "Nootrees", "Nootrees assortment at FairPrice"),
+    ("tempo", "Tempo", "Tempo assortment at FairPrice"),
+)
 
+# RedMart household-paper shop pages; `{shop}` is a brand path such as
+# "kleenex/" or empty for the shared listing.
+_REDMART_LIST_TEMPLATE = "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/{shop}?m=redmart"
+_REDMART_API_TEMPLATE = "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/{shop}?ajax=true&m=redmart"
+
+# (brand, listing shop path, API shop path) per RedMart target. Some brands have
+# no brand listing page and link to the shared one.
+_REDMART_BRANDS: tuple[tuple[str, str, str], ...] = (
+    ("Tempo", "tem-po/", "tem-po/"),
+    ("Kleenex", "kleenex/", "kleenex/"),
+    ("Pursoft", "pursoft/", "pursoft/"),
+    ("Vinda", "vin-da/", "vin-da/"),
+    ("Beautex", "", "beautex/"),
+    ("Paseo", "", "paseo_1/"),
+    ("Cloversoft", "", "cloversoft/"),
+    ("Nootrees", "nootrees/", "nootrees/"),
+)
 
 PRODUCT_CATALOG: dict[str, ProductConfig] = {
     "example-ultra-soft": ProductConfig(
@@ -31,11 +85,13 @@ PRODUCT_CATALOG: dict[str, ProductConfig] = {
         url="https://example.com/toilet-paper",
         size="24 Mega Rolls",
         ply="3",
-        extra_options={
-            "total_reviews": "1500",
-            "total_rating": "4.9",
-            "price": "24.99",
-        },
+        extra_options=MappingProxyType(
+            {
+                "total_reviews": "1500",
+                "total_rating": "4.9",
+                "price": "24.99",
+            }
+        ),
     ),
     "coldstorage-kleenex": ProductConfig(
         slug="coldstorage-kleenex",
@@ -86,295 +142,44 @@ PRODUCT_CATALOG: dict[str, ProductConfig] = {
         site_name="Cold Storage",
         url="https://coldstorage.com.sg/en/category/100013-100174-101066/1.html?proCatId=1&proId=45287",
     ),
-    "fairprice-kleenex": ProductConfig(
-        slug="fairprice-kleenex",
-        brand="Kleenex",
-        description="Kleenex assortment at FairPrice",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Akleenex",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Akleenex&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "fairprice-paseo": ProductConfig(
-        slug="fairprice-paseo",
-        brand="Paseo",
-        description="Paseo assortment at FairPrice",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Apaseo",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Apaseo&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "fairprice-vinda": ProductConfig(
-        slug="fairprice-vinda",
-        brand="Vinda",
-        description="PaVindaseo assortment at FairPrice",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Avinda",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Avinda&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "fairprice-pursoft": ProductConfig(
-        slug="fairprice-pursoft",
-        brand="Pursoft",
-        description="Pursoft assortment at FairPrice",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Apursoft",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Apursoft&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "fairprice-fairprice": ProductConfig(
-        slug="fairprice-fairprice",
-        brand="FairPrice",
-        description="FairPrice house-brand bathroom tissues",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Afairprice",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Afairprice&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "fairprice-beautex": ProductConfig(
-        slug="fairprice-beautex",
-        brand="Beautex",
-        description="Beautex assortment at FairPrice",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Abeautex",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Abeautex&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "fairprice-neutra": ProductConfig(
-        slug="fairprice-neutra",
-        brand="Neutra",
-        description="Neutra assortment at FairPrice",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Aneutra",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Aneutra&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "fairprice-cloversoft": ProductConfig(
-        slug="fairprice-cloversoft",
-        brand="Cloversoft",
-        description="Cloversoft assortment at FairPrice",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Acloversoft",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Acloversoft&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "fairprice-nootrees": ProductConfig(
-        slug="fairprice-nootrees",
-        brand="Nootrees",
-        description="Nootrees assortment at FairPrice",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Anootrees",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Anootrees&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "fairprice-tempo": ProductConfig(
-        slug="fairprice-tempo",
-        brand="Tempo",
-        description="Tempo assortment at FairPrice",
-        site_name="FairPrice",
-        url="https://www.fairprice.com.sg/category/bathroom-tissues?filter=brand%3Atempo",
-        extra_options={
-            "api_url": (
-                "https://website-api.omni.fairprice.com.sg/api/layout/category/v2?"
-                "algopers=prm-ppb-1%2Cprm-ep-1%2Ct-epds-1%2Ct-ppb-0%2Ct-ep-0&"
-                "category=bathroom-tissues&"
-                "experiments=ls_deltime-sortA%2CsearchVariant-B%2Cgv-A%2Cshelflife-B%2Cds-A%2Cls_comsl-B%2C"
-                "cartfiller-a%2Ccatnav-hide%2Ccatbubog-B%2Csbanner-A%2Ccount-b%2Ccam-a%2Cpromobanner-c%2C"
-                "algopers-b%2Cdlv_pref_mf-B%2Cdelivery_pref_ffs-C%2Cdelivery_pref_pfc-C%2Ccrtalc-B%2C"
-                "crt-v-wbble-A%2Czero_search_swimlane-A%2Csd-var-a%2CslotIncentive-eco%2Cosmos-on%2Cgsc-a%2C"
-                "camp-lbl-B%2Cpoa-entry-A&filter=brand%3Atempo&includeTagDetails=true&"
-                "orderType=DELIVERY&page={page}&url=bathroom-tissues"
-            )
-        },
-    ),
-    "redmart-tempo": ProductConfig(
-        slug="redmart-tempo",
-        brand="Tempo",
-        description="Tempo assortment at RedMart",
-        site_name="RedMart",
-        url="https://redmart.lazada.sg/shop-groceries-laundry-household-paper/tem-po/?m=redmart",
-        extra_options={
-            "api_url": "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/tem-po/?ajax=true&m=redmart"
-        },
-    ),
-    "redmart-kleenex": ProductConfig(
-        slug="redmart-kleenex",
-        brand="Kleenex",
-        description="Kleenex assortment at RedMart",
-        site_name="RedMart",
-        url="https://redmart.lazada.sg/shop-groceries-laundry-household-paper/kleenex/?m=redmart",
-        extra_options={
-            "api_url": "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/kleenex/?ajax=true&m=redmart"
-        },
-    ),
-    "redmart-pursoft": ProductConfig(
-        slug="redmart-pursoft",
-        brand="Pursoft",
-        description="Pursoft assortment at RedMart",
-        site_name="RedMart",
-        url="https://redmart.lazada.sg/shop-groceries-laundry-household-paper/pursoft/?m=redmart",
-        extra_options={
-            "api_url": "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/pursoft/?ajax=true&m=redmart"
-        },
-    ),
-    "redmart-vinda": ProductConfig(
-        slug="redmart-vinda",
-        brand="Vinda",
-        description="Vinda assortment at RedMart",
-        site_name="RedMart",
-        url="https://redmart.lazada.sg/shop-groceries-laundry-household-paper/vin-da/?m=redmart",
-        extra_options={
-            "api_url": "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/vin-da/?ajax=true&m=redmart"
-        },
-    ),
-    "redmart-beautex": ProductConfig(
-        slug="redmart-beautex",
-        brand="Beautex",
-        description="Beautex assortment at RedMart",
-        site_name="RedMart",
-        url="https://redmart.lazada.sg/shop-groceries-laundry-household-paper/?m=redmart",
-        extra_options={
-            "api_url": "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/beautex/?ajax=true&m=redmart"
-        },
-    ),
-    "redmart-paseo": ProductConfig(
-        slug="redmart-paseo",
-        brand="Paseo",
-        description="Paseo assortment at RedMart",
-        site_name="RedMart",
-        url="https://redmart.lazada.sg/shop-groceries-laundry-household-paper/?m=redmart",
-        extra_options={
-            "api_url": "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/paseo_1/?ajax=true&m=redmart"
-        },
-    ),
-    "redmart-cloversoft": ProductConfig(
-        slug="redmart-cloversoft",
-        brand="Cloversoft",
-        description="Cloversoft assortment at RedMart",
-        site_name="RedMart",
-        url="https://redmart.lazada.sg/shop-groceries-laundry-household-paper/?m=redmart",
-        extra_options={
-            "api_url": "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/cloversoft/?ajax=true&m=redmart"
-        },
-    ),
-    "redmart-nootrees": ProductConfig(
-        slug="redmart-nootrees",
-        brand="Nootrees",
-        description="Nootrees assortment at RedMart",
-        site_name="RedMart",
-        url="https://redmart.lazada.sg/shop-groceries-laundry-household-paper/nootrees/?m=redmart",
-        extra_options={
-            "api_url": "https://redmart.lazada.sg/shop-groceries-laundry-household-paper/nootrees/?ajax=true&m=redmart"
-        },
-    ),
 }
 
+PRODUCT_CATALOG.update(
+    (
+        f"fairprice-{brand_filter}",
+        ProductConfig(
+            slug=f"fairprice-{brand_filter}",
+            brand=brand,
+            description=description,
+            site_name="FairPrice",
+            url=_FAIRPRICE_LIST_TEMPLATE.format(brand=brand_filter),
+            extra_options=MappingProxyType({"api_url": _FAIRPRICE_API_TEMPLATE.format(brand=brand_filter)}),
+        ),
+    )
+    for brand_filter, brand, description in _FAIRPRICE_BRANDS
+)
+PRODUCT_CATALOG.update(
+    (
+        f"redmart-{brand.lower()}",
+        ProductConfig(
+            slug=f"redmart-{brand.lower()}",
+            brand=brand,
+            description=f"{brand} assortment at RedMart",
+            site_name="RedMart",
+            url=_REDMART_LIST_TEMPLATE.format(shop=list_shop),
+            extra_options=MappingProxyType({"api_url": _REDMART_API_TEMPLATE.format(shop=api_shop)}),
+        ),
+    )
+    for brand, list_shop, api_shop in _REDMART_BRANDS
+)
+
 
 def get_product(slug: str) -> ProductConfig:
-    try:
-        return PRODUCT_CATALOG[slug]
-    except KeyError as exc:
+    config = PRODUCT_CATALOG.get(slug)
+    if config is None:
         msg = f"Product '{slug}' is not defined in the catalog"
-        raise KeyError(msg) from exc
+        raise KeyError(msg)
+    return config
 
 
 def list_products() -> Iterable[ProductConfig]:
@@ -382,39 +187,82 @@ def list_products() -> Iterable[ProductConfig]:
 
 import csv
 import re
+import sys
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 
+@lru_cache(maxsize=1)
 def _default_dataset_path() -> Path:
-    # dataset.csv is expected at the package root (one level up from this file)
+    # dataset.csv is expected at the package root (one level up from this file);
+    # cached because resolve() walks the filesystem and the location is fixed
     return Path(__file__).resolve().parents[1] / "dataset.csv"
 
 
+# A run of non-word characters (dashes included) becomes a single dash, so no
+# second pass is needed to collapse repeated dashes.
+_SLUG_NONWORD = re.compile(r"[^\w]+")
+
+
+@lru_cache(maxsize=256)
 def _slugify(value: str) -> str:
-    value = (value or "").strip().lower()
-    value = re.sub(r"[^\w]+", "-", value)
-    value = re.sub(r"-{2,}", "-", value).strip("-")
+    value = _SLUG_NONWORD.sub("-", (value or "").strip().lower()).strip("-")
     return value or "unknown"
 
 
-def load_dataset_rows(path: str | None = None) -> List[dict]:
+def iter_dataset_rows(path: str | None = None) -> Iterator[dict]:
     """
-    Parse `dataset.csv` and return raw rows as dictionaries.
-    Columns expected (case-insensitive): Brand, Desc, Pack Size, Ply, Rolls, Sheets,
-    Fairprice, Cold Storage, Redmart
+    Yield the rows of `dataset.csv` one at a time as dictionaries with
+    stripped keys and values. See `load_dataset_rows` for the columns.
     """
     dataset_path = Path(path) if path else _default_dataset_path()
-    rows: List[dict] = []
     if not dataset_path.exists():
         raise FileNotFoundError(f"Dataset not found at {dataset_path}")
     with dataset_path.open(encoding="utf-8") as fh:
         reader = csv.DictReader(fh)
         for r in reader:
             # normalize keys to simple names
-            normalized = {k.strip(): (v or "").strip() for k, v in r.items()}
-            rows.append(normalized)
-    return rows
+            yield {k.strip(): (v or "").strip() for k, v in r.items()}
+
+
+def load_dataset_rows(path: str | None = None) -> List[dict]:
+    """
+    Parse `dataset.csv` and return raw rows as dictionaries.
+    Columns expected (case-insensitive): Brand, Desc, Pack Size, Ply, Rolls, Sheets,
+    Fairprice, Cold Storage, Redmart
+    """
+    dataset_path = Path(path) if path else _default_dataset_path()
+    try:
+        st = dataset_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Dataset not found at {dataset_path}") from None
+    # fresh dicts per call: callers may edit their rows without touching the cache
+    return [dict(row) for row in _cached_dataset_rows(str(dataset_path.resolve()), st.st_mtime_ns, st.st_size)]
+
+
+@lru_cache(maxsize=4)
+def _cached_dataset_rows(path: str, mtime_ns: int, size: int) -> tuple[dict, ...]:
+    # keyed on the file's stamp so an edited dataset.csv is read again; every
+    # dataset row run in one process otherwise shares a single parse
+    return tuple(iter_dataset_rows(path))
+
+
+# (CSV column, site name, slug prefix) for the site URL columns of dataset.csv
+_DATASET_SITE_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ("Fairprice", "FairPrice", "fairprice"),
+    ("Cold Storage", "Cold Storage", "cold-storage"),
+    ("Redmart", "RedMart", "redmart"),
+)
+
+
+def _find_column(columns: Iterable[str], *names: str) -> str:
+    """Return the first of `names` present in `columns` (else the first name)."""
+    for name in names:
+        if name in columns:
+            return name
+    return names[0]
 
 
 def load_dataset_products(path: str | None = None) -> List[ProductConfig]:
@@ -422,45 +270,55 @@ def load_dataset_products(path: str | None = None) -> List[ProductConfig]:
     Convert parsed CSV rows into a list of `ProductConfig` instances, one per
     (site,brand) pair when a URL is provided.
     """
-    rows = load_dataset_rows(path)
+    # stream rows so the parsed CSV is never held in memory alongside the configs
+    rows = iter_dataset_rows(path)
     products: List[ProductConfig] = []
-    for row in rows:
-        brand = row.get("Brand") or row.get("brand") or ""
-        description = row.get("Desc") or row.get("description") or ""
+    first_row = next(rows, None)
+    if first_row is None:
+        return products
+    # every row shares the CSV header, so resolve column names once
+    columns = first_row.keys()
+    brand_col = _find_column(columns, "Brand", "brand")
+    description_col = _find_column(columns, "Desc", "description")
+    site_columns = [site for site in _DATASET_SITE_COLUMNS if site[0] in columns]
+    for row in chain((first_row,), rows):
+        # brands repeat across rows; share one string object per brand
+        brand = sys.intern(row.get(brand_col) or "")
+        brand_slug = _slugify(brand)
+        description = row.get(description_col) or f"{brand} assortment"
         size = row.get("Pack Size") or None
         ply = row.get("Ply") or None
-        extra_options = {}
-        if row.get("Rolls"):
-            extra_options["rolls"] = row.get("Rolls")
-        if row.get("Sheets"):
-            extra_options["sheets"] = row.get("Sheets")
-
-        # iterate known site columns
-        for col_name, site_name in (("Fairprice", "FairPrice"), ("Cold Storage", "Cold Storage"), ("Redmart", "RedMart")):
-            url = row.get(col_name) or ""
-            if not url or url.strip() in ("-", ""):
+        # read-only, so the row's configs can share one mapping
+        options = {}
+        rolls = row.get("Rolls")
+        if rolls:
+            options["rolls"] = rolls
+        sheets = row.get("Sheets")
+        if sheets:
+            options["sheets"] = sheets
+        extra_options = MappingProxyType(options) if options else _EMPTY_OPTIONS
+
+        for col_name, site_name, site_slug in site_columns:
+            url = row[col_name]
+            if not url or url == "-":
                 continue
-            site_slug = _slugify(site_name)
-            brand_slug = _slugify(brand)
-            slug = f"{site_slug}-{brand_slug}"
-            prod = ProductConfig(
-                slug=slug,
-                brand=brand,
-                description=description or f"{brand} assortment",
-                site_name=site_name,
-                url=url,
-                size=size or None,
-                ply=ply or None,
-                extra_options=extra_options.copy(),
+            products.append(
+                ProductConfig(
+                    slug=f"{site_slug}-{brand_slug}",
+                    brand=brand,
+                    description=description,
+                    site_name=site_name,
+                    url=url,
+                    size=size,
+                    ply=ply,
+                    extra_options=extra_options,
+                )
             )
-            products.append(prod)
     return products
 
 
 if __name__ == "__main__":  # pragma: no cover - simple CLI
     # Quick CLI to preview parsed rows for manual testing
-    import sys
-
     try:
         preview = load_dataset_products()
     except Exception as exc:
@@ -2,27 +2,81 @@
 
 from __future__ import annotations
 
-import re
-from typing import Any
+from typing import Any, Iterator
 from urllib.parse import urljoin
 
+import soupsieve
 import urllib3
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib3.exceptions import InsecureRequestWarning
 
-urllib3.disable_warnings(InsecureRequestWarning)
-
+from ._patterns import (
+    PLY_PATTERN,
+    PRICE_DECIMAL,
+    PRICE_DECIMAL_TABLE,
+    PRICE_NONDIGIT,
+    PRICE_NONDIGIT_TABLE,
+    SIZE_TOKEN,
+)
 from .base import BaseScraper
 from .models import ProductRecord
 
+try:  # lxml parses these pages several times faster than the stdlib parser
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
+
+urllib3.disable_warnings(InsecureRequestWarning)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching one token of the class attribute, like CSS `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if etree is not None:
+    # Listing card fields, compiled once so the card loop runs C-level walks
+    # instead of building BeautifulSoup nodes. Each `(...)[1]` mirrors `find()`.
+    _CARD_XPATH = etree.XPath(
+        f"//div[{_has_class('list-wrapper')}]//div[{_has_class('row-container')}]//a[{_has_class('ware-wrapper')}]"
+    )
+    _NAME_XPATH = etree.XPath(f"(.//*[{_has_class('name')}])[1]")
+    _PRICE_BOX_XPATH = etree.XPath(f"(.//*[{_has_class('price-box')}])[1]")
+    _PRICE_XPATH = etree.XPath(f"(.//*[{_has_class('price')}])[1]")
+    _SMALL_PRICE_XPATH = etree.XPath(f"(.//*[{_has_class('small-price')}])[1]")
+    _LINE_PRICE_XPATH = etree.XPath(f"(.//*[{_has_class('line-price')}])[1]")
+    _SOLD_XPATH = etree.XPath(f"boolean(.//*[{_has_class('sold')}])")
+    # the strings bs4's get_text() would join: script/style contents excluded
+    _TEXT_XPATH = etree.XPath("descendant::text()[not(parent::script or parent::style)]")
+
+# (href, name, price, cents, list price, sold out) of one listing card; the
+# price fields are None when their node is missing
+_Card = tuple[str, str, "str | None", "str | None", "str | None", bool]
+
 
 class ColdStorageCategoryScraper(BaseScraper):
     """Parses toilet paper listings from Cold Storage."""
 
-    CARD_SELECTOR = "div.list-wrapper div.row-container a.ware-wrapper"
-    PRICE_PATTERN = re.compile(r"[^\d]")
-    PLY_PATTERN = re.compile(r"(\d+)\s*ply", re.IGNORECASE)
-    SIZE_TOKEN_PATTERN = re.compile(r"\b\d+[^\s]*", re.IGNORECASE)
+    # compiled once instead of re-parsing selector strings on every select call
+    CARD_SELECTOR = soupsieve.compile("div.list-wrapper div.row-container a.ware-wrapper")
+    INFO_SELECTOR = soupsieve.compile(".info-content")
+    TITLE_SELECTOR = soupsieve.compile(".title")
+    PRICE_LINE_SELECTOR = soupsieve.compile(".price-line")
+    PRICE_SELECTOR = soupsieve.compile(".price")
+    SMALL_PRICE_SELECTOR = soupsieve.compile(".price-small")
+    # only the listing subtree is needed from category pages
+    LISTING_STRAINER = SoupStrainer("div", class_="list-wrapper")
+    PRICE_PATTERN = PRICE_NONDIGIT
+    DECIMAL_PRICE_PATTERN = PRICE_DECIMAL
+    # translate tables deleting the same characters from ASCII text
+    PRICE_TABLE = PRICE_NONDIGIT_TABLE
+    DECIMAL_PRICE_TABLE = PRICE_DECIMAL_TABLE
+    PLY_PATTERN = PLY_PATTERN
+    SIZE_TOKEN_PATTERN = SIZE_TOKEN
 
     def _scrape(self) -> list[ProductRecord]:
         detail_page = self.job.options.get("dataset_detail_url")
@@ -31,28 +85,31 @@ class ColdStorageCategoryScraper(BaseScraper):
 
         url = self.job.options["url"]
         response = self.fetch(url, verify=False)
-        soup = BeautifulSoup(response.text, "html.parser")
-        cards = soup.select(self.CARD_SELECTOR)
+        cards = self._iter_lxml_cards(response) if etree is not None else self._iter_soup_cards(response)
+        # job-level values are the same for every card; read them once
+        base_url = response.url
+        brand = self.job.brand
+        site = self.job.site_name
+        job_description = self.job.description
+        job_size = self.job.options.get("size")
+        job_ply = self.job.options.get("ply")
         records: list[ProductRecord] = []
-        for card in cards:
-            name = self._text(card.select_one(".name"))
-            if not name:
-                continue
-            listing_url = urljoin(response.url, card.get("href", "").strip())
-            price = self._parse_price(card)
-            list_price = self._parse_line_price(card)
+        for href, name, price_text, cents_text, line_text, sold_out in cards:
+            listing_url = urljoin(base_url, href.strip())
+            price = self._parse_price(price_text, cents_text)
+            list_price = self._parse_line_price(line_text)
             metadata: dict[str, Any] = {
-                "job_description": self.job.description,
+                "job_description": job_description,
                 "raw_name": name,
                 "list_price": list_price,
-                "sold_out": bool(card.select_one(".sold")),
+                "sold_out": sold_out,
             }
             record = ProductRecord(
-                brand=self.job.brand,
+                brand=brand,
                 description=name,
-                site=self.job.site_name,
-                size=self.job.options.get("size") or self._extract_size(name),
-                ply=self.job.options.get("ply") or self._extract_ply(name),
+                site=site,
+                size=job_size or self._extract_size(name),
+                ply=job_ply or self._extract_ply(name),
                 price=price,
                 total_reviews=None,
                 total_rating=None,
@@ -64,12 +121,12 @@ class ColdStorageCategoryScraper(BaseScraper):
 
     def _scrape_detail_page(self, url: str) -> list[ProductRecord]:
         response = self.fetch(url, verify=False)
-        soup = BeautifulSoup(response.text, "html.parser")
-        info = soup.select_one(".info-content")
+        soup = self._soup(response)
+        info = self.INFO_SELECTOR.select_one(soup)
         if not info:
             return []
-        title_node = info.select_one(".title")
-        price_line = info.select_one(".price-line")
+        title_node = self.TITLE_SELECTOR.select_one(info)
+        price_line = self.PRICE_LINE_SELECTOR.select_one(info)
         if not title_node or not price_line:
             return []
         name = title_node.get_text(strip=True)
@@ -94,33 +151,80 @@ class ColdStorageCategoryScraper(BaseScraper):
         )
         return [record]
 
-    def _text(self, node) -> str:
-        return node.get_text(strip=True) if node else ""
+    def _iter_lxml_cards(self, response) -> Iterator[_Card]:
+        """Yield the named listing cards of a category page, read with lxml."""
+        parser = lxml_html.HTMLParser(encoding=response.encoding)
+        try:
+            root = lxml_html.document_fromstring(response.content, parser=parser)
+        except etree.ParserError:  # empty document
+            return
+        for card in _CARD_XPATH(root):
+            name = self._lxml_text(_NAME_XPATH(card))
+            if not name:
+                continue
+            # every price node lives under the card's price box; find it once
+            price_box = _PRICE_BOX_XPATH(card)
+            if price_box:
+                price_box = price_box[0]
+                price = self._lxml_text(_PRICE_XPATH(price_box), None)
+                cents = self._lxml_text(_SMALL_PRICE_XPATH(price_box), None)
+                line_price = self._lxml_text(_LINE_PRICE_XPATH(price_box), None)
+            else:
+                price = cents = line_price = None
+            yield card.get("href", ""), name, price, cents, line_price, _SOLD_XPATH(card)
+
+    def _iter_soup_cards(self, response) -> Iterator[_Card]:
+        """Yield the named listing cards of a category page, read with bs4."""
+        soup = self._soup(response, parse_only=self.LISTING_STRAINER)
+        for card in self.CARD_SELECTOR.select(soup):
+            name = self._text(card.find(class_="name"))
+            if not name:
+                continue
+            price_box = card.find(class_="price-box")
+            if price_box is not None:
+                price = self._text(price_box.find(class_="price"), None)
+                cents = self._text(price_box.find(class_="small-price"), None)
+                line_price = self._text(price_box.find(class_="line-price"), None)
+            else:
+                price = cents = line_price = None
+            yield card.get("href", ""), name, price, cents, line_price, card.find(class_="sold") is not None
+
+    def _lxml_text(self, nodes: list, default: str | None = "") -> str | None:
+        # the first match of a `(...)[1]` XPath, as _text() would render it
+        if not nodes:
+            return default
+        return "".join(text.strip() for text in _TEXT_XPATH(nodes[0]))
 
-    def _parse_price(self, card) -> float | None:
-        price_node = card.select_one(".price-box .price")
-        dollars = self._sanitize_number(price_node)
+    def _soup(self, response, **kwargs: Any) -> BeautifulSoup:
+        # hand the parser raw bytes plus the charset requests would decode with
+        # (None lets bs4 sniff it) instead of materializing response.text first
+        return BeautifulSoup(response.content, HTML_PARSER, from_encoding=response.encoding, **kwargs)
+
+    def _text(self, node, default: str | None = "") -> str | None:
+        return node.get_text(strip=True) if node is not None else default
+
+    def _parse_price(self, price_text: str | None, cents_text: str | None) -> float | None:
+        dollars = self._sanitize_number(price_text)
         if dollars is None:
             return None
-        cents_node = card.select_one(".price-box .small-price")
-        cents = self._sanitize_number(cents_node, allow_empty=True) or "00"
-        return float(f"{dollars}.{cents.zfill(2)}")
+        cents = self._sanitize_number(cents_text, allow_empty=True) or "00"
+        return self._join_price(dollars, cents.zfill(2))
 
-    def _parse_line_price(self, card) -> float | None:
-        node = card.select_one(".price-box .line-price")
-        value = self._sanitize_number(node, allow_decimal=True)
+    def _parse_line_price(self, line_text: str | None) -> float | None:
+        value = self._sanitize_number(line_text, allow_decimal=True)
         return float(value) if value else None
 
     def _sanitize_number(
-        self, node, *, allow_empty: bool = False, allow_decimal: bool = False
+        self, text: str | None, *, allow_empty: bool = False, allow_decimal: bool = False
     ) -> str | None:
-        if not node:
+        if text is None:
             return None if not allow_empty else ""
-        text = node.get_text(strip=True)
-        if allow_decimal:
-            cleaned = re.sub(r"[^\d.]", "", text)
+        if text.isascii():
+            cleaned = text.translate(self.DECIMAL_PRICE_TABLE if allow_decimal else self.PRICE_TABLE)
+        elif allow_decimal:
+            cleaned = self.DECIMAL_PRICE_PATTERN.sub("", text)
         else:
-            cleaned = re.sub(self.PRICE_PATTERN, "", text)
+            cleaned = self.PRICE_PATTERN.sub("", text)
         if not cleaned and not allow_empty:
             return None
         return cleaned
@@ -133,35 +237,24 @@ class ColdStorageCategoryScraper(BaseScraper):
 
     def _extract_size(self, name: str) -> str | None:
         normalized = name
-        if normalized.lower().startswith(self.job.brand.lower()):
-            normalized = normalized[len(self.job.brand) :].strip()
-        tokens: list[str] = []
-        for match in self.SIZE_TOKEN_PATTERN.finditer(normalized):
-            token = match.group(0)
-            if self._is_ply_token(token, normalized, match.start(), match.end()):
-                continue
-            tokens.append(token)
-        value = " ".join(tokens).strip()
+        brand = self.job.brand
+        # lowercase only the prefix that could hold the brand, not the whole name
+        if name[: len(brand)].lower() == brand.lower():
+            normalized = name[len(brand) :].strip()
+        # a token runs up to whitespace and starts after a non-word character,
+        # so "ply" can only touch it from inside ("3ply", "2-Ply")
+        value = " ".join(
+            token for token in self.SIZE_TOKEN_PATTERN.findall(normalized) if "ply" not in token.lower()
+        )
         return value or None
 
-    def _is_ply_token(self, token: str, text: str, start: int, end: int) -> bool:
-        if "ply" in token.lower():
-            return True
-        tail = text[end : end + 4].lower()
-        if tail.startswith("ply"):
-            return True
-        head = text[max(0, start - 3) : start].lower()
-        if head.endswith("ply"):
-            return True
-        return False
-
     def _parse_price_line(self, node) -> float | None:
-        integer = node.select_one(".price")
-        decimal = node.select_one(".price-small")
+        integer = self.PRICE_SELECTOR.select_one(node)
+        decimal = self.SMALL_PRICE_SELECTOR.select_one(node)
         if not integer:
             return None
-        whole = self._sanitize_number(integer) or ""
-        frac = self._sanitize_number(decimal, allow_empty=True) or ""
+        whole = self._sanitize_number(self._text(integer)) or ""
+        frac = self._sanitize_number(self._text(decimal, None), allow_empty=True) or ""
         if frac:
             frac = frac.lstrip(".")
         if not whole and not frac:
@@ -169,7 +262,13 @@ class ColdStorageCategoryScraper(BaseScraper):
         denom = frac.ljust(2, "0") if frac else "00"
         value = whole or "0"
         try:
-            return float(f"{value}.{denom}")
+            return self._join_price(value, denom)
         except ValueError:
             return None
 
+    def _join_price(self, whole: str, fraction: str) -> float:
+        # float(f"{whole}.{fraction}") without building and re-scanning the
+        # string; int / int true division rounds exactly like float() parsing
+        scale = 10 ** len(fraction)
+        return (int(whole) * scale + int(fraction)) / scale
+
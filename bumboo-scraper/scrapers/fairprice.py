@@ -2,24 +2,168 @@
 
 from __future__ import annotations
 
-import json
 import re
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Mapping
 from urllib.parse import urlencode, urljoin, urlparse, urlunparse, parse_qsl
 
 import urllib3
 from bs4 import BeautifulSoup
 
-from .base import BaseScraper
+from ._patterns import AGGREGATE_RATING, PLY_PATTERN, PRICE_NUMBER, REVIEW_RATING
+from .base import BaseScraper, json_loads
 from .models import ProductRecord
 
+try:  # builds the product page tree in C instead of one Python object per node
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None
+
+if etree is not None:
+    # the handful of product page nodes the detail scrape reads; `(...)[1]`
+    # mirrors `find()` returning the first match in document order
+    _LD_JSON_XPATH = etree.XPath("//script[@type='application/ld+json']")
+    _META_PRICE_XPATHS = (
+        etree.XPath("(//meta[@property='og:price:amount'])[1]"),
+        etree.XPath("(//meta[@itemprop='price'])[1]"),
+    )
+    _META_TITLE_XPATHS = (
+        etree.XPath("(//meta[@property='og:title'])[1]"),
+        etree.XPath("(//meta[@name='title'])[1]"),
+    )
+    _H1_XPATH = etree.XPath("(//h1)[1]")
+    # the strings bs4's get_text() would join: script/style contents excluded
+    _TEXT_XPATH = etree.XPath("descendant::text()[not(parent::script or parent::style)]")
+
+# (JSON-LD script bodies, price meta content, title meta content, first <h1>
+# text) of a product page; the meta/h1 fields are None when the node is missing
+_ProductPage = tuple[list["str | None"], "str | None", "str | None", "str | None"]
+# (brand, site, job description, size, ply, dataset description) of the job:
+# the values every API record shares
+_JobFields = tuple[str, str, str, "str | None", "str | None", "str | None"]
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# stand-in for missing optional sub-objects of an API item; read-only so it
+# can be shared across every record
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+# product page price/rating probes, compiled once rather than looked up in
+# re's pattern cache on every page
+_WINDOW_PRICE_RE = re.compile(r'"price"\s*:\s*"?([0-9]+(?:\.[0-9]+)?)"?')
+_LOOSE_NUM_RE = re.compile(r"(?<!\d)([0-9]{1,3}(?:\.[0-9]{1,2})?)(?!\d)")
+_JSONLD_SCRIPT_RE = re.compile(r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.I | re.S)
+_META_PRICE_RE = re.compile(r'<meta[^>]+property=["\']product:price:amount["\'][^>]+content=["\']([\d\.,]+)["\']', re.I)
+_ITEMPROP_PRICE_RE = re.compile(r'itemprop=["\']price["\'][^>]*content=["\']?([\d\.,]+)["\']?', re.I)
+_FINAL_PRICE_RE = re.compile(r'"final_price"\s*:\s*([0-9]+(?:\.[0-9]+)?)')
+_PRICE_KV_RE = re.compile(r'"price"\s*:\s*"?\$?([\d\.,]+)"?')
+_VISIBLE_PRICE_RE = re.compile(r'[$]\s*([\d]{1,3}(?:[,\d{3}]*)(?:\.\d{1,2})?)')
+_PER_PACK_PRICE_RE = re.compile(r'(\d+\.\d{1,2})\s*(?:per|per pack|per pkt)?')
+
+
+_NO_FIELDS: tuple[None, None, None, None] = (None, None, None, None)
+
+
+def _jsonld_fields(root: Any) -> tuple[float | None, Any, Any, Any]:
+    """
+    Extract (price, title, rating, review_count) from a JSON-LD node.
+
+    @graph containers are expanded with an explicit stack rather than
+    recursion; their entries are folded in document order with `or`, so the
+    first truthy value of each field wins.
+    """
+    price = title = rating = review_count = None
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            found = _NO_FIELDS
+        else:
+            graph = node.get("@graph") or node.get("graph")
+            if isinstance(graph, list):
+                if graph:
+                    stack.extend(reversed(graph))
+                    continue
+                # an empty @graph still folds in as a node with no fields
+                found = _NO_FIELDS
+            else:
+                found = _jsonld_node_fields(node)
+        price = price or found[0]
+        title = title or found[1]
+        rating = rating or found[2]
+        review_count = review_count or found[3]
+    return price, title, rating, review_count
+
+
+def _jsonld_node_fields(node: dict) -> tuple[float | None, Any, Any, Any]:
+    """Read price, title, rating and review_count off a single JSON-LD node."""
+    price = None
+    rating = None
+    review_count = None
+    title = node.get("name") or (node.get("brand") or {}).get("name") or None
+    # offers may be dict or list
+    offers = node.get("offers")
+    if offers:
+        if isinstance(offers, list):
+            offers = offers[0] if offers else None
+        if isinstance(offers, dict):
+            p = offers.get("price") or (offers.get("priceSpecification") and offers["priceSpecification"].get("price"))
+            if p:
+                try:
+                    price = float(str(p))
+                except Exception:
+                    price = None
+    # aggregate rating
+    agg = node.get("aggregateRating") or node.get("aggregate_rating")
+    if isinstance(agg, dict):
+        rating = agg.get("ratingValue")
+        review_count = agg.get("reviewCount")
+    # nested review -> reviewRating
+    rev = node.get("review")
+    if isinstance(rev, dict):
+        rr = rev.get("reviewRating") or {}
+        rating = rating or rr.get("ratingValue")
+    return price, title, rating, review_count
+
+
+def _search_agg(root: Any) -> tuple[Any, Any]:
+    """
+    Find the first (ratingValue, reviewCount) pair in a JSON-LD blob.
+
+    Walks the blob depth-first in document order with an explicit stack, so
+    deeply nested @graph data cannot hit the recursion limit. A node typed
+    AggregateRating, or one with an aggregateRating dict, ends its branch; it
+    only wins when at least one of the two values is present.
+    """
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            atype = obj.get("@type") or obj.get("type") or ""
+            if isinstance(atype, str) and atype.lower().startswith("aggregaterating"):
+                found = obj.get("ratingValue"), obj.get("reviewCount")
+            elif isinstance(obj.get("aggregateRating"), dict):
+                ar = obj["aggregateRating"]
+                found = ar.get("ratingValue"), ar.get("reviewCount")
+            else:
+                stack.extend(reversed(obj.values()))
+                continue
+            if found[0] is not None or found[1] is not None:
+                return found
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
+    return (None, None)
+
 
 class FairPriceCategoryScraper(BaseScraper):
     """Hits the FairPrice category API and normalizes items."""
 
-    PLY_PATTERN = re.compile(r"(\d+)\s*ply", re.IGNORECASE)
+    PLY_PATTERN = PLY_PATTERN
+    #: Concurrent category page requests once the page count is known.
+    PAGE_WORKERS = 8
 
     def _scrape(self) -> list[ProductRecord]:
         # Support two modes:
@@ -30,28 +174,38 @@ class FairPriceCategoryScraper(BaseScraper):
         product_page = self.job.options.get("url")
 
         if api_template:
+            # pages are consumed in order exactly as a sequential walk would, but
+            # once a page advertises total_pages the later ones are requested
+            # concurrently instead of one round trip at a time
+            headers = self._headers()
+            page_url = api_template.format
+            job_fields = self._job_fields()
+            executor = ThreadPoolExecutor(max_workers=self.PAGE_WORKERS)
+            pending: dict[int, Future] = {}
             page = 1
-            while True:
-                url = api_template.format(page=page)
-                response = self.fetch(url, headers=self._headers(), verify=False)
-                payload = response.json()
-                collection = self._extract_collection(payload)
-                if not collection:
-                    break
-
-                products = collection.get("product", [])
-                if not products:
-                    break
-
-                for item in products:
-                    record = self._to_record(item)
-                    records.append(record)
-
-                pagination = collection.get("pagination") or {}
-                total_pages = pagination.get("total_pages", page)
-                if page >= total_pages:
-                    break
-                page += 1
+            future = executor.submit(self._fetch_collection, page_url(page=page), headers)
+            try:
+                while True:
+                    collection = future.result()
+                    if not collection:
+                        break
+
+                    products = collection.get("product", [])
+                    if not products:
+                        break
+
+                    records.extend(self._to_record(item, job_fields) for item in products)
+
+                    pagination = collection.get("pagination") or {}
+                    total_pages = pagination.get("total_pages", page)
+                    if page >= total_pages:
+                        break
+                    for ahead in range(max(pending, default=page) + 1, total_pages + 1):
+                        pending[ahead] = executor.submit(self._fetch_collection, page_url(page=ahead), headers)
+                    page += 1
+                    future = pending.pop(page)
+            finally:
+                executor.shutdown(cancel_futures=True)
             return records
 
         if product_page:
@@ -59,70 +213,28 @@ class FairPriceCategoryScraper(BaseScraper):
             try:
                 resp = self.fetch(product_page, headers=self._headers(), verify=False)
                 html = resp.text
-                soup = BeautifulSoup(html, "html.parser")
+                ld_json, meta_price, meta_title, h1_text = self._read_product_page(resp)
+
+                # decode each JSON-LD script once for both passes below; scripts
+                # that are not valid JSON are skipped
+                blobs = []
+                for script in ld_json:
+                    try:
+                        blobs.append(json_loads(script or "{}"))
+                    except Exception:
+                        continue
 
                 # Try JSON-LD first; prefer nodes where "@type" is "Product"
                 price = None
                 title = None
                 rating = None
                 review_count = None
-                for tag in soup.find_all("script", {"type": "application/ld+json"}):
-                    try:
-                        data = json.loads(tag.string or "{}")
-                    except Exception:
-                        continue
-
+                for data in blobs:
                     # normalize to iterable of candidate nodes
                     candidates = data if isinstance(data, list) else [data]
 
-                    def _process_node(node: dict) -> tuple[None | float, None | str, None | object, None | object]:
-                        """Extract price, title, rating, review_count from a JSON-LD node if present."""
-                        local_price = None
-                        local_title = None
-                        local_rating = None
-                        local_review_count = None
-                        if not isinstance(node, dict):
-                            return local_price, local_title, local_rating, local_review_count
-                        # if node contains @graph, inspect graph entries
-                        graph = node.get("@graph") or node.get("graph")
-                        if isinstance(graph, list):
-                            for entry in graph:
-                                p, t, r, rc = _process_node(entry)
-                                local_price = local_price or p
-                                local_title = local_title or t
-                                local_rating = local_rating or r
-                                local_review_count = local_review_count or rc
-                            return local_price, local_title, local_rating, local_review_count
-
-                        typ = node.get("@type") or node.get("type") or ""
-                        # extract title
-                        local_title = node.get("name") or (node.get("brand") or {}).get("name") or None
-                        # offers may be dict or list
-                        offers = node.get("offers")
-                        if offers:
-                            if isinstance(offers, list):
-                                offers = offers[0] if offers else None
-                            if isinstance(offers, dict):
-                                p = offers.get("price") or (offers.get("priceSpecification") and offers["priceSpecification"].get("price"))
-                                if p:
-                                    try:
-                                        local_price = float(str(p))
-                                    except Exception:
-                                        local_price = None
-                        # aggregate rating
-                        agg = node.get("aggregateRating") or node.get("aggregate_rating")
-                        if isinstance(agg, dict):
-                            local_rating = local_rating or agg.get("ratingValue")
-                            local_review_count = local_review_count or agg.get("reviewCount")
-                        # nested review -> reviewRating
-                        rev = node.get("review")
-                        if isinstance(rev, dict):
-                            rr = rev.get("reviewRating") or {}
-                            local_rating = local_rating or rr.get("ratingValue")
-                        return local_price, local_title, local_rating, local_review_count
-
                     for node in candidates:
-                        p, t, r, rc = _process_node(node)
+                        p, t, r, rc = _jsonld_fields(node)
                         if t and not title:
                             title = t
                         if p is not None and price is None:
@@ -135,31 +247,7 @@ class FairPriceCategoryScraper(BaseScraper):
                         break
                 # If rating/review_count not found yet, search JSON-LD blobs for AggregateRating nodes
                 if (rating is None or review_count is None):
-                    def _search_agg(obj):
-                        if isinstance(obj, dict):
-                            atype = obj.get("@type") or obj.get("type") or ""
-                            if isinstance(atype, str) and atype.lower().startswith("aggregaterating"):
-                                return obj.get("ratingValue"), obj.get("reviewCount")
-                            # direct aggregateRating key
-                            if "aggregateRating" in obj and isinstance(obj["aggregateRating"], dict):
-                                ar = obj["aggregateRating"]
-                                return ar.get("ratingValue"), ar.get("reviewCount")
-                            for v in obj.values():
-                                res = _search_agg(v)
-                                if res and (res[0] is not None or res[1] is not None):
-                                    return res
-                        elif isinstance(obj, list):
-                            for it in obj:
-                                res = _search_agg(it)
-                                if res and (res[0] is not None or res[1] is not None):
-                                    return res
-                        return (None, None)
-
-                    for tag in soup.find_all("script", {"type": "application/ld+json"}):
-                        try:
-                            blob = json.loads(tag.string or "{}")
-                        except Exception:
-                            continue
+                    for blob in blobs:
                         r_rating, r_count = _search_agg(blob)
                         if r_rating is not None or r_count is not None:
                             rating = rating or r_rating
@@ -168,22 +256,18 @@ class FairPriceCategoryScraper(BaseScraper):
 
                 # meta tags fallback
                 if price is None:
-                    meta_price = soup.find("meta", {"property": "og:price:amount"}) or soup.find("meta", {"itemprop": "price"})
-                    if meta_price and meta_price.get("content"):
+                    if meta_price:
                         try:
-                            price = float(re.search(r"[\d.]+", meta_price["content"]).group())
+                            price = float(PRICE_NUMBER.search(meta_price).group())
                         except Exception:
                             price = None
 
                 # title fallback
                 if not title:
-                    og_title = soup.find("meta", {"property": "og:title"}) or soup.find("meta", {"name": "title"})
-                    if og_title and og_title.get("content"):
-                        title = og_title["content"]
-                    else:
-                        h1 = soup.find("h1")
-                        if h1:
-                            title = h1.get_text(strip=True)
+                    if meta_title:
+                        title = meta_title
+                    elif h1_text is not None:
+                        title = h1_text
 
                 # Scoped JSON-LD/text search: try to find a Product JSON-LD block in the raw HTML
                 if price is None:
@@ -196,7 +280,7 @@ class FairPriceCategoryScraper(BaseScraper):
                         window_start = max(0, prod_pos - 800)
                         window_end = min(len(html), prod_pos + 2000)
                         window = html[window_start:window_end]
-                        m = re.search(r'"price"\s*:\s*"?([0-9]+(?:\.[0-9]+)?)"?', window)
+                        m = _WINDOW_PRICE_RE.search(window)
                         if m:
                             try:
                                 price = float(m.group(1))
@@ -205,7 +289,7 @@ class FairPriceCategoryScraper(BaseScraper):
 
                 # loose regex fallback for visible price strings like $11.85 or 11.85 (last resort)
                 if price is None:
-                    m = re.search(r"(?<!\d)([0-9]{1,3}(?:\.[0-9]{1,2})?)(?!\d)", html)
+                    m = _LOOSE_NUM_RE.search(html)
                     if m:
                         # choose the first plausible price > 1.0 (exclude small integers like '1' which may be quantity)
                         cand = None
@@ -292,6 +376,47 @@ class FairPriceCategoryScraper(BaseScraper):
             "User-Agent": self.session.headers.get("User-Agent", "Mozilla/5.0"),
         }
 
+    def _read_product_page(self, response) -> _ProductPage:
+        """Pull the JSON-LD blobs, price/title meta content and first <h1> text."""
+        if etree is None:
+            soup = BeautifulSoup(response.text, "html.parser")
+            ld_json = [tag.string for tag in soup.find_all("script", {"type": "application/ld+json"})]
+            price_node = soup.find("meta", {"property": "og:price:amount"}) or soup.find("meta", {"itemprop": "price"})
+            title_node = soup.find("meta", {"property": "og:title"}) or soup.find("meta", {"name": "title"})
+            h1 = soup.find("h1")
+            return (
+                ld_json,
+                price_node.get("content") if price_node else None,
+                title_node.get("content") if title_node else None,
+                h1.get_text(strip=True) if h1 is not None else None,
+            )
+
+        parser = lxml_html.HTMLParser(encoding=response.encoding)
+        try:
+            root = lxml_html.document_fromstring(response.content, parser=parser)
+        except etree.ParserError:  # empty document
+            return [], None, None, None
+        h1 = _H1_XPATH(root)
+        return (
+            [script.text for script in _LD_JSON_XPATH(root)],
+            self._first_content(root, _META_PRICE_XPATHS),
+            self._first_content(root, _META_TITLE_XPATHS),
+            "".join(text.strip() for text in _TEXT_XPATH(h1[0])) if h1 else None,
+        )
+
+    def _first_content(self, root, xpaths) -> str | None:
+        # `find(a) or find(b)`: the first XPath that matches decides, even if
+        # its content attribute is empty
+        for xpath in xpaths:
+            nodes = xpath(root)
+            if nodes:
+                return nodes[0].get("content")
+        return None
+
+    def _fetch_collection(self, url: str, headers: dict[str, str]) -> dict[str, Any] | None:
+        response = self.fetch(url, headers=headers, verify=False)
+        return self._extract_collection(self.decode_json(response))
+
     def _extract_collection(self, payload: dict[str, Any]) -> dict[str, Any] | None:
         try:
             layouts = payload["data"]["page"]["layouts"]
@@ -306,30 +431,46 @@ class FairPriceCategoryScraper(BaseScraper):
                 return collection
         return None
 
-    def _to_record(self, item: dict[str, Any]) -> ProductRecord:
+    def _job_fields(self) -> _JobFields:
+        options = self.job.options
+        return (
+            self.job.brand,
+            self.job.site_name,
+            self.job.description,
+            options.get("size"),
+            options.get("ply"),
+            options.get("dataset_description"),
+        )
+
+    def _to_record(self, item: dict[str, Any], job_fields: _JobFields | None = None) -> ProductRecord:
+        # callers converting a whole page pass job_fields read once up front
+        brand, site, job_description, job_size, job_ply, dataset_description = job_fields or self._job_fields()
         name: str = item.get("name", "").strip()
         slug = item.get("slug", "")
         source_url = urljoin("https://www.fairprice.com.sg/product/", slug)
 
         pricing = self._extract_pricing(item)
-        reviews = (item.get("reviews") or {}).get("statistics") or {}
+        # each optional sub-dict is looked up once; misses share one empty mapping
+        meta = item.get("metaData") or _EMPTY
+        reviews = (item.get("reviews") or _EMPTY).get("statistics") or _EMPTY
+        display_unit = meta.get("DisplayUnit")
         metadata = {
-            "job_description": self.job.description,
+            "job_description": job_description,
             "raw_name": name,
             "list_price": pricing["list_price"],
             "promotion_price": pricing["promotion_price"],
-            "display_unit": (item.get("metaData") or {}).get("DisplayUnit"),
-            "country_of_origin": (item.get("metaData") or {}).get("Country of Origin"),
+            "display_unit": display_unit,
+            "country_of_origin": meta.get("Country of Origin"),
             "offers": item.get("offers", []),
             "original_description": name,
         }
-        record_description = self.job.options.get("dataset_description") or name
+        record_description = dataset_description or name
         return ProductRecord(
-            brand=self.job.brand,
+            brand=brand,
             description=record_description,
-            site=self.job.site_name,
-            size=self.job.options.get("size") or (item.get("metaData") or {}).get("DisplayUnit"),
-            ply=self.job.options.get("ply") or self._extract_ply(name),
+            site=site,
+            size=job_size or display_unit,
+            ply=job_ply or self._extract_ply(name),
             price=pricing["price"],
             total_reviews=self._safe_int(reviews.get("total")),
             total_rating=self._safe_float(reviews.get("average")),
@@ -338,17 +479,18 @@ class FairPriceCategoryScraper(BaseScraper):
         )
 
     def _extract_pricing(self, item: dict[str, Any]) -> dict[str, float | None]:
-        price = self._safe_float(item.get("final_price"))
+        safe_float = self._safe_float
+        price = safe_float(item.get("final_price"))
         list_price = None
         promotion_price = None
 
         if item.get("storeSpecificData"):
             mrp = item["storeSpecificData"][0].get("mrp")
-            list_price = self._safe_float(mrp)
+            list_price = safe_float(mrp)
 
         offers = item.get("offers") or []
         if offers:
-            promotion_price = self._safe_float(offers[0].get("price"))
+            promotion_price = safe_float(offers[0].get("price"))
             price = promotion_price or price
 
         return {"price": price, "list_price": list_price, "promotion_price": promotion_price}
@@ -359,18 +501,21 @@ class FairPriceCategoryScraper(BaseScraper):
             return match.group(1)
         return None
 
-    def _safe_float(self, value: Any) -> float | None:
+    @staticmethod
+    def _safe_float(value: Any) -> float | None:
+        # the API usually sends numbers already; only strings need converting
+        if value is None or type(value) is float:
+            return value
         try:
-            if value is None:
-                return None
             return float(value)
         except (TypeError, ValueError):
             return None
 
-    def _safe_int(self, value: Any) -> int | None:
+    @staticmethod
+    def _safe_int(value: Any) -> int | None:
+        if value is None or type(value) is int:
+            return value
         try:
-            if value is None:
-                return None
             return int(value)
         except (TypeError, ValueError):
             return None
@@ -385,9 +530,9 @@ class FairPriceCategoryScraper(BaseScraper):
         """
         # 1. JSON-LD
         try:
-            for m in re.finditer(r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', html, re.I | re.S):
+            for m in _JSONLD_SCRIPT_RE.finditer(html):
                 try:
-                    obj = json.loads(m.group(1))
+                    obj = json_loads(m.group(1))
                 except Exception:
                     continue
                 # object may be a list or dict
@@ -405,13 +550,13 @@ class FairPriceCategoryScraper(BaseScraper):
             pass
 
         # 2. meta tags and itemprop
-        m = re.search(r'<meta[^>]+property=["\']product:price:amount["\'][^>]+content=["\']([\d\.,]+)["\']', html, re.I)
+        m = _META_PRICE_RE.search(html)
         if m:
             try:
                 return float(m.group(1).replace(",", ""))
             except Exception:
                 pass
-        m = re.search(r'itemprop=["\']price["\'][^>]*content=["\']?([\d\.,]+)["\']?', html, re.I)
+        m = _ITEMPROP_PRICE_RE.search(html)
         if m:
             try:
                 return float(m.group(1).replace(",", ""))
@@ -419,13 +564,13 @@ class FairPriceCategoryScraper(BaseScraper):
                 pass
 
         # 3. inline JS "final_price" or "price" numeric tokens
-        m = re.search(r'"final_price"\s*:\s*([0-9]+(?:\.[0-9]+)?)', html)
+        m = _FINAL_PRICE_RE.search(html)
         if m:
             try:
                 return float(m.group(1))
             except Exception:
                 pass
-        m = re.search(r'"price"\s*:\s*"?\$?([\d\.,]+)"?', html)
+        m = _PRICE_KV_RE.search(html)
         if m:
             try:
                 return float(m.group(1).replace(",", ""))
@@ -433,13 +578,13 @@ class FairPriceCategoryScraper(BaseScraper):
                 pass
 
         # 4. visible price like $11.85 or 11.85
-        m = re.search(r'[$]\s*([\d]{1,3}(?:[,\d{3}]*)(?:\.\d{1,2})?)', html)
+        m = _VISIBLE_PRICE_RE.search(html)
         if m:
             try:
                 return float(m.group(1).replace(",", ""))
             except Exception:
                 pass
-        m = re.search(r'(\d+\.\d{1,2})\s*(?:per|per pack|per pkt)?', html)
+        m = _PER_PACK_PRICE_RE.search(html)
         if m:
             try:
                 return float(m.group(1))
@@ -454,11 +599,7 @@ class FairPriceCategoryScraper(BaseScraper):
         """
         rating = None
         reviews = None
-        match = re.search(
-            r'"aggregateRating"\s*:\s*\{[^}]*"ratingValue"\s*:\s*"([^"]+)"[^}]*"reviewCount"\s*:\s*"([^"]+)"',
-            html,
-            re.S,
-        )
+        match = AGGREGATE_RATING.search(html)
         if match:
             try:
                 rating = float(match.group(1))
@@ -470,11 +611,7 @@ class FairPriceCategoryScraper(BaseScraper):
                 reviews = None
             return rating, reviews
 
-        match = re.search(
-            r'"reviewRating"\s*:\s*\{[^}]*"ratingValue"\s*:\s*"([^"]+)"',
-            html,
-            re.S,
-        )
+        match = REVIEW_RATING.search(html)
         if match:
             try:
                 rating = float(match.group(1))
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from requests import Session
 
 
 @dataclass(slots=True)
@@ -46,7 +49,7 @@ class ScrapeJob:
 class BaseScraper(Protocol):
     """Protocol implemented by every scraper class."""
 
-    def __init__(self, job: ScrapeJob):
+    def __init__(self, job: ScrapeJob, *, session: Session | None = None):
         ...
 
     def scrape(self) -> list[ProductRecord]:
@@ -0,0 +1,220 @@
+"""Normalization utilities for scraped ProductRecord instances.
+
+We try to map scraped brand/description/size combinations to a canonical
+normalized set so inserts into the DB are consistent. If no match is found
+the record is left for manual review.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from dataclasses import fields
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from .models import ProductRecord
+
+
+NORMALIZATION_MAP: list[dict[str, str]] = [
+    {"brand": "Beautex", "description": "Bathroom Tissue Rolls", "size": "20 x 220"},
+    {"brand": "Cloversoft", "description": "Plant-Based Unbleached Bamboo", "size": "10 x 200"},
+    {"brand": "FairPrice", "description": "Onwards Toilet Rolls", "size": "30 x 220"},
+    {"brand": "FairPrice", "description": "DeluxSoft Bathroom Tissue", "size": "20 x 200"},
+    {"brand": "FairPrice", "description": "DeluxSoft Bathroom Tissue", "size": "10 x 200"},
+    {"brand": "FairPrice", "description": "Silky Soft Bathroom", "size": "24 x 200"},
+    {"brand": "FairPrice", "description": "Silky Soft Bathroom", "size": "10 x 200"},
+    {"brand": "FairPrice", "description": "DeluxSoft Bathroom", "size": "100 x 200"},
+    {"brand": "FairPrice", "description": "DeluxSoft Bathroom", "size": "120 (CTN)"},
+    {"brand": "FairPrice", "description": "Silky Soft Bathroom", "size": "100 x 200"},
+    {"brand": "Kleenex", "description": "Toilet Rolls - Ultra Soft", "size": "20 x 200"},
+    {"brand": "Kleenex", "description": "Ultra Soft Cottony", "size": "30 x 200"},
+    {"brand": "Kleenex", "description": "Ultra Soft & Thick", "size": "20 x 180"},
+    {"brand": "Kleenex", "description": "Ultra Soft Aloe", "size": "20 x 190"},
+    {"brand": "Kleenex", "description": "Toilet Rolls - Ultra Soft", "size": "10 x 200"},
+    {"brand": "Kleenex", "description": "Ultra Soft Aloe", "size": "22 x 190"},
+    {"brand": "Kleenex", "description": "Toilet Rolls (4ply) + Moist Wipes", "size": "30 x 180"},
+    {"brand": "Kleenex", "description": "Supreme Soft", "size": "16 x 190"},
+    {"brand": "Kleenex", "description": "Green Tea", "size": "20 x 190"},
+    {"brand": "Kleenex", "description": "Ultra Soft Aloe", "size": "10 x 190"},
+    {"brand": "Neutra", "description": "Bathroom Tissue Rolls", "size": "20 x 190"},
+    {"brand": "NooTrees", "description": "Bamboo Toilet Tissue", "size": "10 x 220"},
+    {"brand": "Paseo", "description": "Bathroom Roll", "size": "10 x 200"},
+    {"brand": "Paseo", "description": "Bathroom Roll", "size": "30 x 200"},
+    {"brand": "Paseo", "description": "Sensitive Skin", "size": "10 x 200"},
+    {"brand": "Paseo", "description": "Sensitive Skin", "size": "20 x 200"},
+    {"brand": "Paseo", "description": "Luxury Pure Pulp", "size": "24 x 180"},
+    {"brand": "Pursoft", "description": "100% Virgin Pulp Unscented", "size": "24 x 1"},
+    {"brand": "Pursoft", "description": "Lavender Vanilla", "size": "24 x 180"},
+    {"brand": "Pursoft", "description": "Bathroom Toilet R - Unscented", "size": "24 x 220"},
+    {"brand": "Pursoft", "description": "Green Tea", "size": "24 x 180"},
+    {"brand": "Pursoft", "description": "Citrus Verbena", "size": "24 x 180"},
+    {"brand": "Pursoft", "description": "Bathroom Toilet R - Unscented", "size": "10 x 220"},
+    {"brand": "Pursoft", "description": "Bathroom Toilet R - Unscented", "size": "10 x 200"},
+    {"brand": "Pursoft", "description": "Charcoal Floral", "size": "10 x 220"},
+    {"brand": "Pursoft", "description": "Lavender Vanilla", "size": "10 x 180"},
+    {"brand": "Pursoft", "description": "Citrus Verbena", "size": "10 x 180"},
+    {"brand": "Pursoft", "description": "Green Tea", "size": "10 x 180"},
+    {"brand": "Pursoft", "description": "Charcoal Floral", "size": "24 x 220"},
+    {"brand": "Tempo", "description": "Bathroom Tissue - Neutral", "size": "10 x 1"},
+    {"brand": "Vinda", "description": "Deluxe Smooth Feel Toilet T", "size": "20 x 240"},
+    {"brand": "Vinda", "description": "Deluxe Smooth Feel Mega Val", "size": "24 x 1"},
+    {"brand": "Vinda", "description": "Prestige Bathroom - 4D Emboss Camillia", "size": "16 x 200"},
+    {"brand": "Vinda", "description": "Prestige Toilet Tissue", "size": "8 x 200"},
+    {"brand": "Vinda", "description": "Prestige Bathroom - 4D Emboss Camillia", "size": "8 x 200"},
+]
+
+# Keyword-based fallbacks: if record description contains these keywords for a brand,
+# map to the canonical description/size.
+KEYWORD_RULES: list[dict[str, object]] = [
+    {"brand": "Pursoft", "keywords": ["green", "tea"], "description": "Green Tea", "size": "24 x 180"},
+    {"brand": "Pursoft", "keywords": ["lavender", "vanilla"], "description": "Lavender Vanilla", "size": "24 x 180"},
+]
+
+
+# Maps every ASCII character outside \w to a space for _clean.
+_PUNCT_TABLE = str.maketrans({c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")})
+_NON_WORD_RE = re.compile(r"[^\w\d]+")
+# Deletes everything but digits, spaces and "x" from ASCII size strings.
+_SIZE_TABLE = str.maketrans({c: None for c in map(chr, range(128)) if c not in "0123456789 x"})
+_DIGITSPACE_RE = re.compile(r"[^\d x]")
+
+
+def _clean(s: str) -> str:
+    if not s:
+        return ""
+    s = s.lower()
+    # translate covers ASCII descriptions; the regex keeps the \w semantics
+    # (dashes, curly quotes, ... are separators) for anything else
+    return " ".join((s.translate(_PUNCT_TABLE) if s.isascii() else _NON_WORD_RE.sub(" ", s)).split())
+
+
+def _size_digits(s: str) -> str:
+    # translate covers the ASCII sizes we scrape; the regex keeps the exact
+    # Unicode digit semantics for anything else
+    return s.translate(_SIZE_TABLE) if s.isascii() else _DIGITSPACE_RE.sub("", s)
+
+
+# Rule-side fields are constant, so normalize them once at import. Stored as
+# parallel tuples indexed by rule position (brand key, cleaned description,
+# size digits, canonical description, canonical size).
+_RULE_BRAND: tuple[str, ...] = tuple(sys.intern(r["brand"].strip().lower()) for r in NORMALIZATION_MAP)
+_RULE_DESCRIPTION_CLEAN: tuple[str, ...] = tuple(_clean(r["description"]) for r in NORMALIZATION_MAP)
+_RULE_SIZE_DIGITS: tuple[str, ...] = tuple(_size_digits(r["size"].lower()) for r in NORMALIZATION_MAP)
+_RULE_DESCRIPTION: tuple[str, ...] = tuple(r["description"] for r in NORMALIZATION_MAP)
+_RULE_SIZE: tuple[str, ...] = tuple(r["size"] for r in NORMALIZATION_MAP)
+
+
+# Rules grouped by brand, in rule order, as (rule index, cleaned description,
+# size digits), so matching only visits rules of the record's brand.
+_RULES_BY_BRAND: dict[str, list[tuple[int, str, str]]] = {}
+# First rule index per (brand, size digits). An exact size match implies equal
+# size digits, so this one lookup covers both equality cases of the size check.
+_SIZE_INDEX: dict[tuple[str, str], int] = {}
+# A rule with the same brand, cleaned description and size digits as an
+# earlier one matches exactly the same records, so it can never be first.
+_seen_rules: set[tuple[str, str, str]] = set()
+for _index, _key in enumerate(zip(_RULE_BRAND, _RULE_DESCRIPTION_CLEAN, _RULE_SIZE_DIGITS)):
+    if _key in _seen_rules:
+        continue
+    _seen_rules.add(_key)
+    _brand, _description, _digits = _key
+    _RULES_BY_BRAND.setdefault(_brand, []).append((_index, _description, _digits))
+    _SIZE_INDEX.setdefault((_brand, _digits), _index)
+
+_NO_MATCH = len(NORMALIZATION_MAP)
+
+# Keyword rules grouped by brand, in rule order, as (keyword set, canonical
+# description, canonical size). A rule applies when all its keywords are words
+# of the cleaned record description, so each check is a subset test.
+_KEYWORD_RULES_BY_BRAND: dict[str, list[tuple[frozenset[str], str, str]]] = {}
+for _rule in KEYWORD_RULES:
+    _KEYWORD_RULES_BY_BRAND.setdefault(sys.intern(_rule["brand"].strip().lower()), []).append(
+        (frozenset(k.lower() for k in _rule["keywords"]), _rule["description"], _rule["size"])
+    )
+
+
+def _match_rule(brand: str | None, description: str | None, size: str | None) -> int | None:
+    """Return the index of the first rule matching these record fields, or None."""
+    # interned so dict probes against the (interned) rule brands hit the
+    # identity fast path
+    brand = sys.intern((brand or "").strip().lower())
+    size_digits = _size_digits((size or "").strip().lower())
+    description = _clean(description)
+    # the indexed size hit bounds the scan; an earlier rule of the same brand
+    # can still win on description or fuzzy size digits
+    limit = _SIZE_INDEX.get((brand, size_digits), _NO_MATCH) if size_digits else _NO_MATCH
+    for index, rule_description, rule_digits in _RULES_BY_BRAND.get(brand, ()):
+        if index >= limit:
+            break
+        if rule_description in description or (size_digits and rule_digits in size_digits):
+            limit = index
+            break
+    if limit == _NO_MATCH:
+        return None
+    return limit
+
+
+def _match_keywords(brand: str | None, description: str | None) -> tuple[str, str] | None:
+    """Return the canonical (description, size) of the first keyword rule that applies, or None."""
+    rules = _KEYWORD_RULES_BY_BRAND.get((brand or "").strip().lower())
+    if not rules:
+        return None
+    tokens = frozenset(_clean(description).split())
+    for keywords, canonical_description, canonical_size in rules:
+        if keywords.issubset(tokens):
+            return canonical_description, canonical_size
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _canonical(brand: str | None, description: str | None, size: str | None) -> tuple[str, str] | None:
+    """Canonical (description, size) for these record fields, or None when no rule applies."""
+    # the same products come back on every page and every run, so the
+    # outcome is cached per distinct (brand, description, size)
+    index = _match_rule(brand, description, size)
+    if index is None:
+        return _match_keywords(brand, description)
+    return _RULE_DESCRIPTION[index], _RULE_SIZE[index]
+
+
+# ProductRecord's init fields other than the two the rules rewrite, read once
+# so a field added to the model is carried over automatically
+_COPIED_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(ProductRecord) if f.init and f.name not in ("description", "size")
+)
+
+
+def _with_canonical(record: ProductRecord, description: str, size: str) -> ProductRecord:
+    if record.description == description and record.size == size:
+        return record
+    # what dataclasses.replace() builds, without its per-call field introspection
+    kwargs = {name: getattr(record, name) for name in _COPIED_FIELDS}
+    return ProductRecord(description=description, size=size, **kwargs)
+
+
+def normalize_record(record: ProductRecord) -> ProductRecord | None:
+    """Return `record` with the canonical description/size of the first
+    matching rule, falling back to the keyword rules; None when nothing matches.
+    """
+    canonical = _canonical(record.brand, record.description, record.size)
+    if canonical is None:
+        return None
+    return _with_canonical(record, *canonical)
+
+
+def normalize_records(records: Iterable[ProductRecord]) -> Tuple[List[ProductRecord], List[ProductRecord]]:
+    matched: List[ProductRecord] = []
+    unmatched: List[ProductRecord] = []
+    # bind the per-record lookups to locals for the loop
+    canonical_for = _canonical
+    with_canonical = _with_canonical
+    add_matched = matched.append
+    add_unmatched = unmatched.append
+    for record in records:
+        canonical = canonical_for(record.brand, record.description, record.size)
+        if canonical is None:
+            add_unmatched(record)
+        else:
+            add_matched(with_canonical(record, *canonical))
+    return matched, unmatched
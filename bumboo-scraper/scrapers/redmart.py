@@ -4,16 +4,43 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlencode, urljoin, urlparse, parse_qsl, urlunparse
 
 import urllib3
 
-from .base import BaseScraper
+from ._patterns import AGGREGATE_RATING, PRICE_DECIMAL_TABLE, PRICE_NUMBER, REVIEW_RATING
+from .base import BaseScraper, json_loads
 from .models import ProductRecord
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# compiled once rather than looked up in re's pattern cache on every call
+_NON_NUM_RE = re.compile(r"[^\d\.]")
+_NORMALIZE_RE = re.compile(r"[^\w]+")
+# product pages are searched as raw bytes and only the captured groups are
+# decoded, so the full body never has to be turned into a str
+_TRACKING_RE = re.compile(rb'var\s+pdpTrackingData\s*=\s*"(?P<payload>(?:\\.|[^"])*)";', re.S)
+_REVIEW_RATING_BYTES = re.compile(REVIEW_RATING.pattern.encode(), re.S)
+_AGGREGATE_RATING_BYTES = re.compile(AGGREGATE_RATING.pattern.encode(), re.S)
+
+
+def _search_from(pattern: re.Pattern[bytes], anchor: bytes, html: bytes) -> re.Match[bytes] | None:
+    # every match starts with `anchor`, so bytes.find() can skip the page up to
+    # its first occurrence much faster than the regex engine scans it
+    start = html.find(anchor)
+    return pattern.search(html, start) if start >= 0 else None
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(value: str | None) -> str | None:
+    # cached because dataset filtering sees the same descriptions on every
+    # page and across jobs
+    if not value:
+        return None
+    return _NORMALIZE_RE.sub(" ", value).strip().lower()
+
 
 class RedMartBrandScraper(BaseScraper):
     """Parses RedMart brand pages that return JSON when `ajax=true` is set."""
@@ -36,10 +63,11 @@ class RedMartBrandScraper(BaseScraper):
 
         if api_url:
             url = api_url
+            headers = self._headers()
             seen_ids: set[str] = set()
             while url:
-                response = self.fetch(url, headers=self._headers(), verify=False)
-                payload = response.json()
+                response = self.fetch(url, headers=headers, verify=False)
+                payload = self.decode_json(response)
                 items = self._extract_items(payload)
                 if not items:
                     break
@@ -57,18 +85,19 @@ class RedMartBrandScraper(BaseScraper):
         if product_page:
             try:
                 response = self.fetch(product_page, headers=self._headers(), verify=False)
-                html = response.text
+                html = response.content
+                encoding = response.encoding or "utf-8"
                 price = None
                 rating = None
                 reviews = None
 
-                tracking = self._extract_tracking_data(html)
+                tracking = self._extract_tracking_data(html, encoding)
                 if tracking:
                     price = self._parse_price_value(tracking.get("pdt_price"))
                     rating = rating or self._coerce_float(tracking.get("ratingValue"))
                     reviews = reviews or self._coerce_int(tracking.get("reviewCount"))
 
-                parsed_rating, parsed_reviews = self._parse_rating_from_html(html)
+                parsed_rating, parsed_reviews = self._parse_rating_from_html(html, encoding)
                 rating = rating or parsed_rating
                 reviews = reviews or parsed_reviews
 
@@ -180,7 +209,7 @@ class RedMartBrandScraper(BaseScraper):
             return None
         if isinstance(value, (int, float)):
             return float(value)
-        match = re.search(r"[\d.]+", value)
+        match = PRICE_NUMBER.search(value)
         if match:
             try:
                 return float(match.group())
@@ -193,7 +222,8 @@ class RedMartBrandScraper(BaseScraper):
             return None
         match = self.PLY_PATTERN.search(text)
         if match:
-            return next(filter(None, match.groups()))
+            # exactly one alternative matched, and its digits are never empty
+            return match.group(1) or match.group(2)
         return None
 
     def _extract_size(self, item: dict[str, Any]) -> str | None:
@@ -255,7 +285,10 @@ class RedMartBrandScraper(BaseScraper):
     def _parse_price_value(self, value: str | None) -> float | None:
         if not value:
             return None
-        cleaned = re.sub(r"[^\d\.]", "", value)
+        if value.isascii():
+            cleaned = value.translate(PRICE_DECIMAL_TABLE)
+        else:
+            cleaned = _NON_NUM_RE.sub("", value)
         if not cleaned:
             return None
         try:
@@ -263,70 +296,59 @@ class RedMartBrandScraper(BaseScraper):
         except Exception:
             return None
 
-    def _extract_tracking_data(self, html: str) -> dict[str, Any] | None:
-        match = re.search(
-            r'var\s+pdpTrackingData\s*=\s*"(?P<payload>(?:\\.|[^"])*)";',
-            html,
-            re.S,
-        )
+    def _decode(self, data: bytes, encoding: str) -> str:
+        # decoded the way requests builds response.text
+        try:
+            return data.decode(encoding, errors="replace")
+        except LookupError:
+            return data.decode("utf-8", errors="replace")
+
+    def _extract_tracking_data(self, html: bytes, encoding: str = "utf-8") -> dict[str, Any] | None:
+        match = _TRACKING_RE.search(html)
         if not match:
             return None
-        payload = match.group("payload")
+        payload = self._decode(match.group("payload"), encoding)
         try:
-            decoded = json.loads(f'"{payload}"')
+            decoded = json_loads(f'"{payload}"')
         except json.JSONDecodeError:
             try:
                 decoded = payload.encode("utf-8").decode("unicode_escape")
             except Exception:
                 decoded = payload
         try:
-            return json.loads(decoded)
+            return json_loads(decoded)
         except Exception:
             return None
 
-    def _parse_rating_from_html(self, html: str) -> tuple[float | None, int | None]:
+    def _parse_rating_from_html(self, html: bytes, encoding: str = "utf-8") -> tuple[float | None, int | None]:
         rating = None
         reviews = None
-        match = re.search(
-            r'"reviewRating"\s*:\s*\{[^}]*"ratingValue"\s*:\s*"([^"]+)"',
-            html,
-            re.S,
-        )
+        match = _search_from(_REVIEW_RATING_BYTES, b'"reviewRating"', html)
         if match:
             try:
-                rating = float(match.group(1))
+                rating = float(self._decode(match.group(1), encoding))
             except Exception:
                 rating = None
-        match = re.search(
-            r'"aggregateRating"\s*:\s*\{[^}]*"ratingValue"\s*:\s*"([^"]+)"[^}]*"reviewCount"\s*:\s*"([^"]+)"',
-            html,
-            re.S,
-        )
+        match = _search_from(_AGGREGATE_RATING_BYTES, b'"aggregateRating"', html)
         if match:
             if rating is None:
                 try:
-                    rating = float(match.group(1))
+                    rating = float(self._decode(match.group(1), encoding))
                 except Exception:
                     rating = None
             try:
-                reviews = int(float(match.group(2)))
+                reviews = int(float(self._decode(match.group(2), encoding)))
             except Exception:
                 reviews = None
         return rating, reviews
 
-    def _normalize_name(self, value: str | None) -> str | None:
-        if not value:
-            return None
-        cleaned = re.sub(r"[^\w]+", " ", value).strip().lower()
-        return cleaned
-
     def _filter_by_dataset(self, records: list[ProductRecord]) -> list[ProductRecord]:
-        target = self._normalize_name(self.job.options.get("dataset_product_name"))
+        target = _normalize_name(self.job.options.get("dataset_product_name"))
         if not target:
             return records
         matched: list[ProductRecord] = []
         for record in records:
-            normalized_desc = self._normalize_name(record.description)
+            normalized_desc = _normalize_name(record.description)
             if normalized_desc and target in normalized_desc:
                 original_desc = record.description
                 record.metadata["original_description"] = original_desc
@@ -2,14 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping
+from functools import partial
 
 from .catalog import ProductConfig, get_product
-from .coldstorage import ColdStorageCategoryScraper
-from .example import ExampleScraper
-from .fairprice import FairPriceCategoryScraper
 from .models import ScrapeJob
-from .redmart import RedMartBrandScraper
 
 COLD_STORAGE_SLUGS = [
     "coldstorage-kleenex",
@@ -56,6 +53,8 @@ def _options_from_config(config: ProductConfig) -> dict[str, str]:
 
 
 def _build_example_job() -> ScrapeJob:
+    from .example import ExampleScraper
+
     config = get_product("example-ultra-soft")
     return ScrapeJob(
         name="example",
@@ -68,6 +67,8 @@ def _build_example_job() -> ScrapeJob:
 
 
 def _build_coldstorage_job(slug: str) -> ScrapeJob:
+    from .coldstorage import ColdStorageCategoryScraper
+
     config = get_product(slug)
     return ScrapeJob(
         name=slug,
@@ -79,11 +80,9 @@ def _build_coldstorage_job(slug: str) -> ScrapeJob:
     )
 
 
-def _build_coldstorage_jobs() -> dict[str, ScrapeJob]:
-    return {slug: _build_coldstorage_job(slug) for slug in COLD_STORAGE_SLUGS}
-
-
 def _build_fairprice_job(slug: str) -> ScrapeJob:
+    from .fairprice import FairPriceCategoryScraper
+
     config = get_product(slug)
     return ScrapeJob(
         name=slug,
@@ -95,11 +94,9 @@ def _build_fairprice_job(slug: str) -> ScrapeJob:
     )
 
 
-def _build_fairprice_jobs() -> dict[str, ScrapeJob]:
-    return {slug: _build_fairprice_job(slug) for slug in FAIRPRICE_SLUGS}
-
-
 def _build_redmart_job(slug: str) -> ScrapeJob:
+    from .redmart import RedMartBrandScraper
+
     config = get_product(slug)
     return ScrapeJob(
         name=slug,
@@ -111,16 +108,37 @@ def _build_redmart_job(slug: str) -> ScrapeJob:
     )
 
 
-def _build_redmart_jobs() -> dict[str, ScrapeJob]:
-    return {slug: _build_redmart_job(slug) for slug in REDMART_SLUGS}
+class _LazyJobs(Mapping[str, ScrapeJob]):
+    """
+    Job registry that builds each ScrapeJob on first lookup.
+
+    The builders import their scraper module themselves, so running a few jobs
+    only loads the parsers (bs4, lxml, ...) those jobs actually use.
+    """
+
+    def __init__(self) -> None:
+        self._builders = {
+            "example": _build_example_job,
+            **{slug: partial(_build_coldstorage_job, slug) for slug in COLD_STORAGE_SLUGS},
+            **{slug: partial(_build_fairprice_job, slug) for slug in FAIRPRICE_SLUGS},
+            **{slug: partial(_build_redmart_job, slug) for slug in REDMART_SLUGS},
+        }
+        self._jobs: dict[str, ScrapeJob] = {}
+
+    def __getitem__(self, name: str) -> ScrapeJob:
+        job = self._jobs.get(name)
+        if job is None:
+            job = self._jobs[name] = self._builders[name]()
+        return job
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
 
 
-SCRAPE_JOBS: dict[str, ScrapeJob] = {
-    "example": _build_example_job(),
-    **_build_coldstorage_jobs(),
-    **_build_fairprice_jobs(),
-    **_build_redmart_jobs(),
-}
+SCRAPE_JOBS: Mapping[str, ScrapeJob] = _LazyJobs()
 
 
 def get_job(name: str) -> ScrapeJob:
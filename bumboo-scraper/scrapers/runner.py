@@ -5,19 +5,22 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Iterable
 
 from dotenv import load_dotenv
 
+from .base import BaseScraper, enable_http_cache
 from .models import ProductRecord, ScrapeJob
+from .normalizer import normalize_records
 from .registry import get_job, list_jobs
-from .storage import LocalJSONStorage, SupabaseStorage
-# normalize_records may be dynamically imported at runtime to avoid module path issues
-from .catalog import get_product, load_dataset_rows
-from .fairprice import FairPriceCategoryScraper
-from .coldstorage import ColdStorageCategoryScraper
-from .redmart import RedMartBrandScraper
-import re
+from .storage import LocalJSONStorage, SupabaseStorage, SupabaseUpsertError
+from .catalog import _slugify, get_product, load_dataset_rows
+
+if TYPE_CHECKING:
+    from requests import Session
 
 logger = logging.getLogger("scraper-runner")
 
@@ -49,6 +52,17 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Skip Supabase persistence (useful for dry runs)",
     )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Cache HTTP responses on disk for an hour (development; needs requests-cache; implies --skip-supabase)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of scrape jobs to run concurrently (default: 4)",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -66,19 +80,35 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def run_job(job: ScrapeJob) -> list[ProductRecord]:
+def run_job(job: ScrapeJob, session: Session | None = None) -> list[ProductRecord]:
     logger.info("Running job '%s' for brand '%s'", job.name, job.brand)
-    scraper = job.scraper(job)
+    scraper = job.scraper(job, session=session)
     records = scraper.scrape()
     logger.info("Job '%s' produced %d record(s)", job.name, len(records))
     return records
 
 
-def _slugify(value: str) -> str:
-    v = (value or "").strip().lower()
-    v = re.sub(r"[^\w]+", "-", v)
-    v = re.sub(r"-{2,}", "-", v).strip("-")
-    return v or "unknown"
+def run_jobs(jobs: Iterable[ScrapeJob], *, workers: int, session: Session | None = None) -> list[ProductRecord]:
+    """Run jobs on a thread pool and return their records in job order."""
+    # jobs are network-bound, so run them on a thread pool; they share one
+    # HTTP session so later jobs reuse connections opened by earlier ones to
+    # the same storefront. map() keeps records in job order
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    workers = max(1, min(workers, len(jobs)))
+    all_records: list[ProductRecord] = []
+    own_session = session is None
+    if own_session:
+        session = BaseScraper.new_session()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for records in executor.map(partial(run_job, session=session), jobs):
+                all_records.extend(records)
+    finally:
+        if own_session:
+            session.close()
+    return all_records
 
 
 def build_jobs_from_dataset_row(row_index: int, dataset_path: str | None = None) -> list[ScrapeJob]:
@@ -87,6 +117,12 @@ def build_jobs_from_dataset_row(row_index: int, dataset_path: str | None = None)
     Cold Storage, and RedMart only when the dataset row has a product URL for that site.
     Jobs reuse the existing ProductConfig entries (API-based).
     """
+    # imported here, like the registry builders, so plain --jobs runs only load
+    # the scrapers they use
+    from .coldstorage import ColdStorageCategoryScraper
+    from .fairprice import FairPriceCategoryScraper
+    from .redmart import RedMartBrandScraper
+
     rows = load_dataset_rows(dataset_path)
     if row_index < 0 or row_index >= len(rows):
         raise IndexError(f"dataset row {row_index} out of range (0..{len(rows)-1})")
@@ -151,32 +187,28 @@ def build_jobs_from_dataset_row(row_index: int, dataset_path: str | None = None)
     return jobs
 
 
-def persist_records(
+@dataclass(slots=True)
+class StagedRecords:
+    """One batch of normalized records waiting to be stored."""
+
+    matched: list[ProductRecord]
+    unmatched: list[ProductRecord]
+    dataset_row: int | None = None
+    #: True once the matched records were dumped locally (--dump-first)
+    dumped: bool = False
+
+
+def stage_records(
     records: Iterable[ProductRecord],
     *,
-    table: str,
-    skip_supabase: bool,
-    force_local_dump: bool,
     dump_first: bool = False,
     dataset_row: int | None = None,
-) -> None:
+) -> StagedRecords | None:
+    """Normalize records and write their local audit dumps; None when there are no records."""
     records = list(records)
     if not records:
         logger.info("No records to persist")
-        return
-    # Import normalizer lazily so module resolution works when running as a module
-    try:
-        from .normalizer import normalize_records  # type: ignore
-    except Exception:
-        try:
-            import normalizer as _normalizer  # type: ignore
-
-            normalize_records = _normalizer.normalize_records  # type: ignore
-        except Exception:
-            logger.warning("Normalizer not available; skipping normalization")
-            def normalize_records(x):
-                return list(x), []
-
+        return None
     # Normalize records first; write unmatched to a separate file for manual review
     matched, unmatched = normalize_records(records)
     if unmatched:
@@ -184,34 +216,88 @@ def persist_records(
         output_path_unmatched = LocalJSONStorage().dump_with_prefix(unmatched, prefix=prefix_unmatched)
         logger.info("Wrote %d unmatched record(s) to %s", len(unmatched), output_path_unmatched)
 
-    stored = False
+    staged = StagedRecords(matched, unmatched, dataset_row)
     # If requested, write matched set first for auditing before attempting Supabase
-    matched_dump_written = False
     if matched and dump_first:
         prefix_matched = f"scrape_row{dataset_row}" if dataset_row is not None else "scrape"
         output_path = LocalJSONStorage().dump_with_prefix(matched, prefix=prefix_matched)
         logger.info("Wrote JSON copy to %s (dump-first)", output_path)
-        matched_dump_written = True
+        staged.dumped = True
+    return staged
+
 
+def store_staged(
+    batches: Iterable[StagedRecords],
+    *,
+    table: str,
+    skip_supabase: bool,
+    force_local_dump: bool,
+    storage: SupabaseStorage | None = None,
+) -> None:
+    """Upsert the matched records of every batch in one go, dumping locally as needed."""
+    batches = list(batches)
+    matched = [record for batch in batches for record in batch.matched]
+    # the first `stored_count` matched records are in Supabase
+    stored_count = 0
     if matched and not skip_supabase:
         try:
-            SupabaseStorage(table_name=table).upsert(matched)
-        except RuntimeError as exc:
+            (storage or SupabaseStorage(table_name=table)).upsert(matched)
+        except SupabaseUpsertError as exc:
+            stored_count = exc.stored
+            logger.error(
+                "Supabase upsert failed after %d of %d record(s) (%s); dumping the rest locally",
+                exc.stored,
+                len(matched),
+                exc.__cause__,
+            )
+        except Exception as exc:
+            # missing credentials, client or request errors: keep the records locally
             logger.warning("Supabase disabled (%s); falling back to local dump", exc)
         else:
-            stored = True
+            stored_count = len(matched)
             logger.info("Persisted %d normalized record(s) to Supabase table '%s'", len(matched), table)
+    stored = bool(matched) and stored_count == len(matched)
 
     # Always write a local dump if requested or Supabase not used for matched records.
     if force_local_dump or not stored:
-        # write matched set (normalized) for auditing unless already written via dump-first
-        if matched and not matched_dump_written:
-            prefix_matched = f"scrape_row{dataset_row}" if dataset_row is not None else "scrape"
-            output_path = LocalJSONStorage().dump_with_prefix(matched, prefix=prefix_matched)
-            logger.info("Wrote JSON copy to %s", output_path)
-        elif unmatched and not matched:
-            # nothing matched and user wanted a local dump; unmatched already written
-            logger.info("No matched records to dump; unmatched records available")
+        offset = 0
+        for batch in batches:
+            # without --local-dump only the records that did not reach Supabase are dumped
+            dump = batch.matched if force_local_dump else batch.matched[max(0, stored_count - offset) :]
+            offset += len(batch.matched)
+            # write matched set (normalized) for auditing unless already written via dump-first
+            if batch.matched and not batch.dumped:
+                if not dump:
+                    continue
+                row = batch.dataset_row
+                prefix_matched = f"scrape_row{row}" if row is not None else "scrape"
+                output_path = LocalJSONStorage().dump_with_prefix(dump, prefix=prefix_matched)
+                logger.info("Wrote JSON copy to %s", output_path)
+            elif batch.unmatched and not batch.matched:
+                # nothing matched and user wanted a local dump; unmatched already written
+                logger.info("No matched records to dump; unmatched records available")
+
+
+def persist_records(
+    records: Iterable[ProductRecord],
+    *,
+    table: str,
+    skip_supabase: bool,
+    force_local_dump: bool,
+    dump_first: bool = False,
+    dataset_row: int | None = None,
+    storage: SupabaseStorage | None = None,
+) -> None:
+    staged = stage_records(records, dump_first=dump_first, dataset_row=dataset_row)
+    if staged is None:
+        return
+    store_staged(
+        [staged],
+        table=table,
+        skip_supabase=skip_supabase,
+        force_local_dump=force_local_dump,
+        storage=storage,
+    )
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -225,6 +311,17 @@ def main(argv: list[str] | None = None) -> None:
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
 
+    if args.http_cache:
+        # cached responses can be up to an hour old but would be stored with a
+        # fresh collected_at, so never let them reach the price history
+        if not args.skip_supabase:
+            logger.info("--http-cache implies --skip-supabase")
+            args.skip_supabase = True
+        try:
+            enable_http_cache()
+        except ImportError:
+            logger.warning("requests-cache is not installed; running without HTTP cache")
+
     selected_jobs: Iterable[ScrapeJob]
     if args.dataset_row is not None:
         # build jobs only for the requested dataset row
@@ -238,9 +335,7 @@ def main(argv: list[str] | None = None) -> None:
     else:
         selected_jobs = list_jobs()
 
-    all_records: list[ProductRecord] = []
-    for job in selected_jobs:
-        all_records.extend(run_job(job))
+    all_records = run_jobs(selected_jobs, workers=args.workers)
 
     persist_records(
         all_records,
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import asdict
+from dataclasses import fields
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
@@ -13,10 +14,77 @@ from supabase import Client, create_client
 
 from .models import ProductRecord
 
+try:  # encodes dumps several times faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# ProductRecord's fields in declaration order, i.e. the key order asdict() used
+_RECORD_FIELDS = tuple(f.name for f in fields(ProductRecord))
+
+
+def _serialize_record(record: ProductRecord) -> dict:
+    # a shallow read instead of asdict(), which deep-copies every value; the
+    # dict is encoded straight away, so sharing metadata with the record is safe
+    data = {name: getattr(record, name) for name in _RECORD_FIELDS}
+    data["collected_at"] = record.collected_at.isoformat()
+    return data
+
+
+def _encode_record(data: dict) -> bytes:
+    """Encode one serialized record as indented JSON, via orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # integers beyond 64 bits, non-str keys, ... which json accepts
+            pass
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _write_json_array(path: Path, records: Iterable[ProductRecord]) -> None:
+    """Write records to `path` as an indented JSON array, one record at a time."""
+    # each record is encoded and written on its own, so the full list of dicts
+    # and the full document never exist at the same time
+    with path.open("wb") as fh:
+        try:
+            separator = b"[\n  "
+            for record in records:
+                fh.write(separator)
+                # json strings never contain a raw newline, so this only indents
+                fh.write(_encode_record(_serialize_record(record)).replace(b"\n", b"\n  "))
+                separator = b",\n  "
+            fh.write(b"[]" if separator == b"[\n  " else b"\n]")
+        except BaseException:
+            # don't leave a truncated dump behind
+            fh.close()
+            path.unlink(missing_ok=True)
+            raise
+
+
+@lru_cache(maxsize=8)
+def _client(url: str, key: str) -> Client:
+    # one client (and its pooled HTTPS connection) per set of credentials,
+    # shared by every SupabaseStorage in the process
+    return create_client(url, key)
+
+
+class SupabaseUpsertError(RuntimeError):
+    """An upsert failed part-way; the first `stored` records are already in the table."""
+
+    def __init__(self, stored: int, unsent: list[ProductRecord]) -> None:
+        super().__init__(f"upsert failed after {stored} record(s); {len(unsent)} record(s) not sent")
+        self.stored = stored
+        self.unsent = unsent
+
 
 class SupabaseStorage:
     """Simple Supabase upsert helper."""
 
+    # rows per upsert request
+    BATCH_SIZE = 500
+
     def __init__(self, table_name: str = "tissue_prices") -> None:
         url = os.getenv("SUPABASE_URL")
         key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
@@ -24,16 +92,24 @@ class SupabaseStorage:
             msg = "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set"
             raise RuntimeError(msg)
         self.table_name = table_name
-        self.client: Client = create_client(url, key)
+        self.client: Client = _client(url, key)
 
     def upsert(self, records: Iterable[ProductRecord]) -> None:
-        payload = []
-        for record in records:
-            serialized = asdict(record)
-            serialized["collected_at"] = record.collected_at.isoformat()
-            payload.append(serialized)
-        if not payload:
-            return
+        """Upsert records in batches, in order.
+
+        Raises SupabaseUpsertError naming the records that were not sent when a
+        batch fails, so the caller can keep them locally.
+        """
+        records = list(records)
+        size = self.BATCH_SIZE
+        # sequential on purpose: a failure leaves a clean prefix in the table
+        for start in range(0, len(records), size):
+            try:
+                self._upsert_batch([_serialize_record(record) for record in records[start : start + size]])
+            except Exception as exc:
+                raise SupabaseUpsertError(start, records[start:]) from exc
+
+    def _upsert_batch(self, payload: list[dict]) -> None:
         self.client.table(self.table_name).upsert(payload).execute()
 
 
@@ -45,27 +121,15 @@ class LocalJSONStorage:
         self.base_path.mkdir(parents=True, exist_ok=True)
 
     def dump(self, records: Iterable[ProductRecord]) -> Path:
-        serialized = []
-        for record in records:
-            data = asdict(record)
-            data["collected_at"] = record.collected_at.isoformat()
-            serialized.append(data)
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         output_path = self.base_path / f"scrape_{timestamp}.json"
-        output_path.write_text(
-            json.dumps(serialized, indent=2), encoding="utf-8"
-        )
+        _write_json_array(output_path, records)
         return output_path
 
     def dump_with_prefix(self, records: Iterable[ProductRecord], prefix: str = "scrape") -> Path:
         """Dump records to data/raw/{prefix}_{timestamp}.json"""
-        serialized = []
-        for record in records:
-            data = asdict(record)
-            data["collected_at"] = record.collected_at.isoformat()
-            serialized.append(data)
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         output_path = self.base_path / f"{prefix}_{timestamp}.json"
-        output_path.write_text(json.dumps(serialized, indent=2), encoding="utf-8")
+        _write_json_array(output_path, records)
         return output_path
 
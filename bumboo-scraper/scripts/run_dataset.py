@@ -1,17 +1,31 @@
-"""Utility script to run every row in dataset.csv via scrapers.runner."""
+"""Utility script to run every row in dataset.csv with the scrapers.runner helpers."""
 
 from __future__ import annotations
 
 import argparse
-import subprocess
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT_DIR))
 
+from dotenv import load_dotenv
+
+from scrapers.base import BaseScraper
 from scrapers.catalog import load_dataset_rows
+from scrapers.runner import (
+    StagedRecords,
+    build_jobs_from_dataset_row,
+    run_jobs,
+    stage_records,
+    store_staged,
+)
+from scrapers.storage import SupabaseStorage
+
+logger = logging.getLogger("run-dataset")
 
 
 def iter_indexes(start: int | None, end: int | None) -> Iterable[int]:
@@ -43,55 +57,100 @@ def main() -> None:
     parser.add_argument(
         "--log-level",
         default="INFO",
-        help="Log level forwarded to scrapers.runner",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Log level for the scrape run",
     )
     parser.add_argument(
         "--local-dump",
         action="store_true",
-        help="Forward --local-dump to the runner",
+        help="Always write a JSON copy of each row under data/raw",
     )
     parser.add_argument(
         "--dump-first",
         action="store_true",
-        help="Forward --dump-first to the runner",
+        help="Write each row's local dump before attempting Supabase",
     )
     parser.add_argument(
         "--table",
         default="tissue_prices",
         help="Supabase table name to upsert into",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of rows to run at the same time (default: 4)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Print commands without executing them",
+        help="Print the rows that would run without scraping them",
     )
 
     args = parser.parse_args()
+    indexes = list(iter_indexes(args.start, args.end))
+    if args.dry_run:
+        for idx in indexes:
+            print(f"Would run row {idx}")
+        return
 
-    python_cmd = [ROOT_DIR / "venv" / "bin" / "python"]
-    if not python_cmd[0].exists():
-        python_cmd = ["python"]
-
-    for idx in iter_indexes(args.start, args.end):
-        cmd = [
-            *python_cmd,
-            "-m",
-            "scrapers.runner",
-            "--dataset-row",
-            str(idx),
-            "--table",
-            args.table,
-            "--log-level",
-            args.log_level,
-        ]
-        # forward dump-first and local-dump flags if provided to this script
-        if args.dump_first:
-            cmd.append("--dump-first")
-        if args.local_dump:
-            cmd.append("--local-dump")
-        print(f"Running row {idx}: {' '.join(cmd)}")
-        if not args.dry_run:
-            subprocess.run(cmd, check=True)
+    try:
+        load_dotenv()
+    except PermissionError as exc:
+        logger.warning("Could not read .env (%s); continuing without it", exc)
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+    try:
+        storage: SupabaseStorage | None = SupabaseStorage(table_name=args.table)
+    except Exception:
+        # store_staged logs the reason and falls back to local dumps
+        storage = None
+
+    def run_row(idx: int) -> StagedRecords | None:
+        logger.info("Running row %d", idx)
+        try:
+            jobs = build_jobs_from_dataset_row(idx)
+        except Exception as exc:
+            logger.error("Could not build jobs from dataset: %s", exc)
+            return None
+        return stage_records(
+            run_jobs(jobs, workers=len(jobs), session=session),
+            dump_first=args.dump_first,
+            dataset_row=idx,
+        )
+
+    # rows run in this process so the interpreter, imports, HTTP session and
+    # Supabase client are set up once; they wait on the network, so a few of
+    # them run side by side
+    failed: list[int] = []
+    staged: list[StagedRecords] = []
+    workers = max(1, min(args.concurrency, len(indexes)))
+    with BaseScraper.new_session() as session, ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_row, idx) for idx in indexes]
+        for idx, future in zip(indexes, futures):
+            try:
+                batch = future.result()
+            except Exception:
+                # one bad row does not stop the batch
+                logger.exception("Row %d failed", idx)
+                failed.append(idx)
+            else:
+                if batch is not None:
+                    staged.append(batch)
+
+    # every row's matched records go to Supabase in one batched upsert rather
+    # than one round-trip per row; the per-row dumps keep their own files
+    store_staged(
+        staged,
+        table=args.table,
+        skip_supabase=False,
+        force_local_dump=args.local_dump,
+        storage=storage,
+    )
+    if failed:
+        sys.exit(f"{len(failed)} row(s) failed: {', '.join(map(str, failed))}")
 
 
 if __name__ == "__main__":
@@ -24,3 +24,74 @@ create index if not exists tissue_prices_site_idx on public.tissue_prices (site)
 create index if not exists tissue_prices_size_idx on public.tissue_prices (size);
 create index if not exists tissue_prices_ply_idx on public.tissue_prices (ply);
 
+
+-- Aggregates behind the API's /api/products and /api/price-history, so the
+-- backend receives one row per product (or per day and site) instead of every
+-- price row in the window.
+create or replace function public.product_aggregates(
+  days integer,
+  brand_filter text default null,
+  site_filter text default null
+)
+returns table (
+  brand varchar,
+  description text,
+  size varchar,
+  sites varchar[],
+  count bigint,
+  avg_price double precision,
+  min_price double precision,
+  max_price double precision,
+  latest_price double precision
+)
+language sql
+stable
+as $$
+  select
+    p.brand,
+    p.description,
+    p.size,
+    coalesce(array_agg(distinct p.site) filter (where p.site <> ''), '{}'),
+    count(*),
+    avg(p.price)::double precision,
+    min(p.price)::double precision,
+    max(p.price)::double precision,
+    (array_agg(p.price order by p.collected_at desc))[1]::double precision
+  from public.tissue_prices p
+  where p.collected_at >= now() - make_interval(days => product_aggregates.days)
+    and p.collected_at < now()
+    and (brand_filter is null or p.brand = brand_filter)
+    and (site_filter is null or p.site = site_filter)
+  group by p.brand, p.description, p.size;
+$$;
+
+create or replace function public.price_history_daily(
+  brand_filter text,
+  description_filter text,
+  site_filter text default null,
+  days integer default 30
+)
+returns table (
+  day date,
+  site text,
+  avg_price double precision,
+  price_count bigint
+)
+language sql
+stable
+as $$
+  select
+    (p.collected_at at time zone 'utc')::date,
+    case when p.site = '' then 'unknown' else btrim(p.site, E' \t\r\n') end,
+    avg(p.price)::double precision,
+    count(*)
+  from public.tissue_prices p
+  where p.collected_at >= now() - make_interval(days => price_history_daily.days)
+    and p.collected_at < now()
+    and p.brand = brand_filter
+    and p.description = description_filter
+    and (site_filter is null or p.site = site_filter)
+    and p.price is not null
+  group by 1, 2
+  order by 1, 2;
+$$;
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import os
-import glob
 import json
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -12,19 +11,44 @@ from fastapi import FastAPI, HTTPException, Query, Depends
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 import secrets
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import re
+import threading
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 
 try:
     from supabase import create_client
 except Exception:
     create_client = None  # type: ignore
 
+try:  # parses the local scrape dumps several times faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 # load environment from .env if present
 load_dotenv()
 
 
+# compiled once; the fallback below runs for every row that fromisoformat rejects
+_TZ_COLON = re.compile(r"([+-]\d{2}):(\d{2})$")
+_DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S.%f%z",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+)
+
+
 def _parse_iso_datetime(value: str) -> datetime | None:
     """Robustly parse various ISO datetime strings into datetime.
     Returns None if parsing fails.
@@ -43,29 +67,20 @@ def _parse_iso_datetime(value: str) -> datetime | None:
     except Exception:
         pass
     # normalize timezone like +00:00 -> +0000 for strptime %z
-    tz_match = re.search(r"([+-]\d{2}):(\d{2})$", s)
+    tz_match = _TZ_COLON.search(s)
     s2 = s
     if tz_match:
         s2 = s[: tz_match.start(1)] + tz_match.group(1) + tz_match.group(2)
     # try common strptime formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%S.%f%z",
-        "%Y-%m-%dT%H:%M:%S%z",
-        "%Y-%m-%d %H:%M:%S.%f%z",
-        "%Y-%m-%d %H:%M:%S%z",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d %H:%M:%S.%f",
-        "%Y-%m-%d %H:%M:%S",
-    ]
-    for fm in formats:
+    for fm in _DATETIME_FORMATS:
         try:
             return datetime.strptime(s2, fm)
         except Exception:
             continue
     return None
 
-APP = FastAPI(title="Bumboo API")
+# orjson renders the larger row lists several times faster than stdlib json
+APP = FastAPI(title="Bumboo API", default_response_class=ORJSONResponse if orjson is not None else JSONResponse)
 APP.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
 SUPA_URL = os.getenv("SUPABASE_URL")
@@ -106,15 +121,132 @@ class PriceRow(BaseModel):
     collected_at: str
 
 
-def _load_latest_json() -> list[dict[str, Any]]:
+def _response_rows(resp: Any) -> list[dict[str, Any]]:
+    # supabase-py 2.x (pinned in requirements.txt) returns an APIResponse
+    # whose rows are always on .data
+    return getattr(resp, "data", None) or []
+
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file, via orjson when installed."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals, ... which json accepts
+            pass
+    return json.loads(data.decode("utf-8"))
+
+
+# parsed dump files keyed by path, with the (mtime, size) they were read at;
+# the dumps are only ever read, so every request can share the parsed rows
+_JSON_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+# sync endpoints run on FastAPI's threadpool; this guards _JSON_CACHE,
+# _DATED_CACHE and _LOCAL_INDEX (reentrant, the loaders nest)
+_CACHE_LOCK = threading.RLock()
+
+
+def _load_cached_json(path: str, stamp: tuple[int, int]) -> Any:
+    """Like _load_json_file, but only re-parse the file once its (mtime, size) stamp changes."""
+    with _CACHE_LOCK:
+        cached = _JSON_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        # a dump still being written fails to parse and is simply not cached
+        data = _load_json_file(path)
+        _JSON_CACHE[path] = (stamp, data)
+        return data
+
+
+def _scan_local_files() -> list[tuple[str, tuple[int, int]]]:
+    """
+    Return (path, (mtime, size)) of the local scrape dumps in name order,
+    dropping cache entries for removed files.
+    """
     root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../bumboo-scraper/data/raw"))
-    pattern = os.path.join(root, "scrape_*.json")
-    files = glob.glob(pattern)
+    # one directory read; the stamps come from the same walk instead of a
+    # separate stat per file for every cache lookup
+    files = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("scrape_") and name.endswith(".json") and entry.is_file():
+                    st = entry.stat()
+                    files.append((entry.path, (st.st_mtime_ns, st.st_size)))
+    except FileNotFoundError:
+        return []
+    files.sort()
+    present = {path for path, _ in files}
+    with _CACHE_LOCK:
+        for cache in (_JSON_CACHE, _DATED_CACHE):
+            for path in [p for p in cache if p not in present]:
+                cache.pop(path, None)
+    return files
+
+
+# rows of one dump paired with their collected_at, read as UTC, keyed like
+# _JSON_CACHE; rows without a usable timestamp are left out
+_DATED_CACHE: dict[str, tuple[tuple[int, int], list[tuple[datetime, dict[str, Any]]]]] = {}
+# (files and stamps it was built from, sorted timestamps, (timestamp, position, row))
+_LOCAL_INDEX: tuple[tuple, list[datetime], list[tuple[datetime, int, dict[str, Any]]]] | None = None
+
+
+def _dated_rows(path: str, stamp: tuple[int, int]) -> list[tuple[datetime, dict[str, Any]]]:
+    """Return a dump's rows with parsed timestamps, parsing each file version once."""
+    with _CACHE_LOCK:
+        cached = _DATED_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        dated = []
+        for it in _load_cached_json(path, stamp):
+            ca = it.get("collected_at")
+            try:
+                dt = _parse_iso_datetime(ca)
+                if dt is None:
+                    continue
+            except Exception:
+                continue
+            dated.append((dt.replace(tzinfo=timezone.utc), it))
+        _DATED_CACHE[path] = (stamp, dated)
+        return dated
+
+
+def _load_local_rows(start_dt: datetime, now: datetime) -> list[dict[str, Any]]:
+    """Rows of every local dump whose collected_at falls in [start_dt, now]."""
+    global _LOCAL_INDEX
+    with _CACHE_LOCK:
+        signature = []
+        parts = []
+        for f, stamp in _scan_local_files():
+            try:
+                dated = _dated_rows(f, stamp)
+            except Exception:
+                continue
+            signature.append((f, stamp))
+            parts.append(dated)
+        signature = tuple(signature)
+        index = _LOCAL_INDEX
+        if index is None or index[0] != signature:
+            # positions are unique, so sorting never falls through to the rows
+            entries = sorted((dt, pos, it) for pos, (dt, it) in enumerate(chain.from_iterable(parts)))
+            index = _LOCAL_INDEX = (signature, [entry[0] for entry in entries], entries)
+    # the index is never mutated once built, so the window is read unlocked
+    _, keys, entries = index
+    window = entries[bisect_left(keys, start_dt) : bisect_right(keys, now)]
+    # hand rows back in file order, as a scan of the dumps would
+    window.sort(key=itemgetter(1))
+    return [entry[2] for entry in window]
+
+
+def _load_latest_json() -> list[dict[str, Any]]:
+    files = _scan_local_files()
     if not files:
         return []
-    latest = max(files, key=os.path.getmtime)
-    with open(latest, "r", encoding="utf-8") as fh:
-        return json.load(fh)
+    latest, stamp = max(files, key=lambda f: f[1][0])
+    return _load_cached_json(latest, stamp)
 
 
 @APP.get("/api/health")
@@ -151,12 +283,7 @@ def prices(
             end = (d + timedelta(days=1)).replace(tzinfo=timezone.utc).isoformat()
             query = query.gte("collected_at", start).lt("collected_at", end)
         try:
-            resp = query.limit(limit).execute()
-            data = getattr(resp, "data", None) or resp[0] if isinstance(resp, (list, tuple)) else resp
-            if isinstance(data, dict) and "data" in data:
-                rows = data["data"]
-            else:
-                rows = data or []
+            rows = _response_rows(query.limit(limit).execute())
             return [PriceRow(**r) for r in rows]
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
@@ -192,6 +319,24 @@ if __name__ == "__main__":
     uvicorn.run("main:APP", host="0.0.0.0", port=port, log_level="info")
 
 
+# the columns the aggregate endpoints read; /api/prices still returns whole rows
+_PRODUCT_COLUMNS = "brand,description,size,site,price,collected_at"
+_HISTORY_COLUMNS = "brand,description,site,price,collected_at"
+
+
+def _aggregate_rpc(name: str, params: dict[str, Any]) -> list[dict[str, Any]] | None:
+    """
+    Call one of the aggregate functions from sql/schema.sql.
+
+    Returns None when the call fails (e.g. the function is not installed yet),
+    so the endpoint can fall back to fetching raw rows.
+    """
+    try:
+        return _response_rows(SUPA_CLIENT.rpc(name, params).execute())
+    except Exception:
+        return None
+
+
 @APP.get("/api/products")
 def products(
     brand: str | None = Query(None),
@@ -208,40 +353,41 @@ def products(
 
     rows = []
     if SUPA_CLIENT:
+        # let Postgres group the window and send back one row per product
+        aggregates = _aggregate_rpc(
+            "product_aggregates",
+            {"days": days, "brand_filter": brand or None, "site_filter": site or None},
+        )
+        if aggregates is not None:
+            return [
+                {
+                    "brand": a["brand"],
+                    "description": a["description"],
+                    "size": a["size"],
+                    "sites": a["sites"] or [],
+                    "sites_count": len(a["sites"] or []),
+                    "image": "/static/placeholder.jpg",
+                    "count": a["count"],
+                    "avg_price": a["avg_price"],
+                    "min_price": a["min_price"],
+                    "max_price": a["max_price"],
+                    "latest_price": a["latest_price"],
+                }
+                for a in aggregates
+            ]
         try:
-            resp = SUPA_CLIENT.table("tissue_prices").select("*").gte("collected_at", start).lt("collected_at", end).execute()
-            # normalize response: try .data, then dict["data"], then list
-            if hasattr(resp, "data"):
-                rows = resp.data or []
-            elif isinstance(resp, dict) and "data" in resp:
-                rows = resp["data"] or []
-            elif isinstance(resp, (list, tuple)):
-                # some clients return (data, count)
-                rows = list(resp[0]) if resp and isinstance(resp[0], list) else list(resp)
-            else:
-                rows = []
+            query = SUPA_CLIENT.table("tissue_prices").select(_PRODUCT_COLUMNS).gte("collected_at", start).lt("collected_at", end)
+            # filter server-side; the Python filters below then keep every row
+            if brand:
+                query = query.eq("brand", brand)
+            if site:
+                query = query.eq("site", site)
+            rows = _response_rows(query.execute())
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
     else:
         # load local files
-        root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../bumboo-scraper/data/raw"))
-        files = sorted(glob.glob(os.path.join(root, "scrape_*.json")))
-        for f in files:
-            with open(f, "r", encoding="utf-8") as fh:
-                try:
-                    items = json.load(fh)
-                except Exception:
-                    continue
-                for it in items:
-                    ca = it.get("collected_at")
-                    try:
-                        dt = _parse_iso_datetime(ca)
-                        if dt is None:
-                            continue
-                    except Exception:
-                        continue
-                    if dt.replace(tzinfo=timezone.utc) >= start_dt and dt.replace(tzinfo=timezone.utc) <= now:
-                        rows.append(it)
+        rows = _load_local_rows(start_dt, now)
 
     # apply filters
     filtered = []
@@ -304,58 +450,10 @@ def products(
     return out
 
 
-@APP.get("/api/price-history")
-def price_history(
-    brand: str = Query(...),
-    description: str = Query(...),
-    site: str | None = Query(None),
-    days: int = Query(30, ge=1, le=365),
-    credentials: HTTPBasicCredentials = Depends(SECURITY),
-):
-    """Return daily aggregated price history for the selected product."""
-    require_auth(credentials)
-    now = datetime.now(timezone.utc)
-    start_dt = now - timedelta(days=days)
-    start = start_dt.isoformat()
-    end = now.isoformat()
-
-    rows = []
-    if SUPA_CLIENT:
-        try:
-            resp = SUPA_CLIENT.table("tissue_prices").select("*").gte("collected_at", start).lt("collected_at", end).execute()
-            if hasattr(resp, "data"):
-                rows = resp.data or []
-            elif isinstance(resp, dict) and "data" in resp:
-                rows = resp["data"] or []
-            elif isinstance(resp, (list, tuple)):
-                rows = list(resp[0]) if resp and isinstance(resp[0], list) else list(resp)
-            else:
-                rows = []
-        except Exception as exc:
-            raise HTTPException(status_code=500, detail=str(exc))
-    else:
-        root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../bumboo-scraper/data/raw"))
-        files = sorted(glob.glob(os.path.join(root, "scrape_*.json")))
-        for f in files:
-            with open(f, "r", encoding="utf-8") as fh:
-                try:
-                    items = json.load(fh)
-                except Exception:
-                    continue
-                for it in items:
-                    ca = it.get("collected_at")
-                    try:
-                        dt = _parse_iso_datetime(ca)
-                        if dt is None:
-                            continue
-                    except Exception:
-                        continue
-                    if dt.replace(tzinfo=timezone.utc) >= start_dt and dt.replace(tzinfo=timezone.utc) <= now:
-                        rows.append(it)
-
-    # filter and bucket by date
-    # filter and bucket by date and site
-    # buckets[date][site] = [prices...]
+def _bucket_prices(
+    rows: list[dict[str, Any]], brand: str, description: str, site: str | None
+) -> dict[str, dict[str, list[float]]]:
+    """Group the product's prices by collected_at date and site: buckets[date][site] = [prices...]."""
     buckets: dict[str, dict[str, list[float]]] = {}
     for r in rows:
         if r.get("brand") != brand:
@@ -374,42 +472,96 @@ def price_history(
             continue
         site_name = (r.get("site") or "unknown").strip()
         buckets.setdefault(dt, {}).setdefault(site_name, []).append(float(price))
+    return buckets
+
+
+@lru_cache(maxsize=256)
+def _site_field(site_name: str) -> str | None:
+    """Map a site name to the canonical field used by the frontend."""
+    # cached: a handful of distinct site names recur across every request
+    s = (site_name or "").lower().strip()
+    # normalize common variants
+    s_norm = s.replace("-", " ").replace("_", " ")
+    # explicit checks for known vendors
+    if any(tok in s_norm for tok in ("fairprice", "fair price", "fair", "FairPrice")):
+        return "fairprice"
+    if any(tok in s_norm for tok in ("coldstorage", "cold storage", "cold")):
+        return "coldStorage"
+    if any(tok in s_norm for tok in ("redmart", "red mart", "red", "lazada", "lzd")):
+        return "redmart"
+    return None
 
-    # helper map site name to canonical fields used by frontend
-    def site_field(site_name: str) -> str | None:
-        s = (site_name or "").lower().strip()
-        # normalize common variants
-        s_norm = s.replace("-", " ").replace("_", " ")
-        # explicit checks for known vendors
-        if any(tok in s_norm for tok in ("fairprice", "fair price", "fair", "FairPrice")):
-            return "fairprice"
-        if any(tok in s_norm for tok in ("coldstorage", "cold storage", "cold")):
-            return "coldStorage"
-        if any(tok in s_norm for tok in ("redmart", "red mart", "red", "lazada", "lzd")):
-            return "redmart"
-        return None
 
-    # build time series per day with per-site aggregates
+@APP.get("/api/price-history")
+def price_history(
+    brand: str = Query(...),
+    description: str = Query(...),
+    site: str | None = Query(None),
+    days: int = Query(30, ge=1, le=365),
+    credentials: HTTPBasicCredentials = Depends(SECURITY),
+):
+    """Return daily aggregated price history for the selected product."""
+    require_auth(credentials)
+    now = datetime.now(timezone.utc)
+    start_dt = now - timedelta(days=days)
+    start = start_dt.isoformat()
+    end = now.isoformat()
+
+    # stats[date][site] = (average price, number of prices)
+    stats: dict[str, dict[str, tuple[float, int]]] = {}
+    daily = None
+    if SUPA_CLIENT:
+        # let Postgres average each (day, site) bucket
+        daily = _aggregate_rpc(
+            "price_history_daily",
+            {"brand_filter": brand, "description_filter": description, "site_filter": site or None, "days": days},
+        )
+    if daily is not None:
+        for d in daily:
+            stats.setdefault(d["day"], {})[d["site"]] = (d["avg_price"], d["price_count"])
+    else:
+        rows = []
+        if SUPA_CLIENT:
+            try:
+                query = (
+                    SUPA_CLIENT.table("tissue_prices")
+                    .select(_HISTORY_COLUMNS)
+                    .eq("brand", brand)
+                    .eq("description", description)
+                    .gte("collected_at", start)
+                    .lt("collected_at", end)
+                )
+                if site:
+                    query = query.eq("site", site)
+                rows = _response_rows(query.execute())
+            except Exception as exc:
+                raise HTTPException(status_code=500, detail=str(exc))
+        else:
+            rows = _load_local_rows(start_dt, now)
+        for day, per_site in _bucket_prices(rows, brand, description, site).items():
+            stats[day] = {name: (sum(prices) / len(prices), len(prices)) for name, prices in per_site.items()}
+
+    # build time series per day with per-site aggregates; only days with at
+    # least one price have a bucket, and ISO dates sort chronologically
+    first_day = start_dt.date().isoformat()
+    last_day = (start_dt + timedelta(days=days)).date().isoformat()
     out: list[dict[str, object]] = []
-    for i in range(days + 1):
-        day = (start_dt + timedelta(days=i)).date().isoformat()
-        per_site = buckets.get(day, {})
+    for day in sorted(stats):
+        if not first_day <= day <= last_day:
+            continue
         entry: dict[str, object] = {"date": day, "count": 0}
         # initialize fields
         entry["fairprice"] = None
         entry["coldStorage"] = None
         entry["redmart"] = None
         total_count = 0
-        for site_name, prices in per_site.items():
-            fld = site_field(site_name)
-            avg = sum(prices) / len(prices) if prices else None
+        for site_name, (avg, price_count) in stats[day].items():
+            fld = _site_field(site_name)
             if fld:
                 entry[fld] = avg
-            total_count += len(prices)
+            total_count += price_count
         entry["count"] = total_count
-        # only include days that have at least one price record
-        if total_count > 0:
-            out.append(entry)
+        out.append(entry)
     return out
 
 